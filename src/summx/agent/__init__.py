@@ -1,4 +1,13 @@
 from .executor import PaperAgent, PlanExecutor
-from .planner import QueryPlanner
+from .factory import build_agent
+from .planner import QueryPlanner, RuleBasedPlanner
+from .summarizer import Summarizer
 
-__all__ = ["PaperAgent", "PlanExecutor", "QueryPlanner"]
+__all__ = [
+    "PaperAgent",
+    "PlanExecutor",
+    "QueryPlanner",
+    "RuleBasedPlanner",
+    "Summarizer",
+    "build_agent",
+]
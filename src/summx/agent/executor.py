@@ -1,117 +1,372 @@
 import asyncio
-import json
 import logging
-import re
-from typing import List, Tuple
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from summx.llm import LLMClient
+from summx.cache import CacheStats, SummaryCache, prompt_hash
+from summx.llm import LLMClient, record_answering_providers
+from summx.prompts import SUMMARIZER_SYSTEM_PROMPT
 from summx.sources.base import PaperSourceClient
+from summx.utils import find_arxiv_ids, split_arxiv_id
 from summx.models import (
+    DepthType,
     PaperContentSections,
+    PaperMeta,
     PaperResult,
     PaperSummary,
     SearchPlan,
 )
-from .planner import QueryPlanner
+from .planner import QueryPlanner, RuleBasedPlanner
+from .summarizer import Summarizer
 
 logger = logging.getLogger(__name__)
 
 
+# Tells a pipeline stage's workers that there is no more input.
+_END_OF_STAGE = object()
+
+
+@dataclass
+class _PaperJob:
+    """A paper moving through the execution pipeline."""
+
+    rank: int
+    meta: PaperMeta
+    cache_key: Optional[str] = None
+    content: Optional[PaperContentSections] = None
+
+
+def _first_error(group: BaseExceptionGroup) -> BaseException:
+    """The first exception in a (possibly nested) exception group."""
+    error: BaseException = group
+    while isinstance(error, BaseExceptionGroup):
+        error = error.exceptions[0]
+    return error
+
+
 class PlanExecutor:
-    """Executes a SearchPlan to fetch and summarize papers."""
+    """
+    Executes a SearchPlan to fetch and summarize papers.
 
-    def __init__(self, source_client: PaperSourceClient, summarizer_llm: LLMClient):
+    Papers flow through download -> extract -> summarize stages. Each stage has its
+    own concurrency limit and the stages are connected by bounded queues, so a slow
+    stage applies backpressure upstream instead of letting downloads, parsed text or
+    LLM requests pile up.
+    """
+
+    def __init__(
+        self,
+        source_client: PaperSourceClient,
+        summarizer_llm: LLMClient,
+        summary_cache: Optional[SummaryCache] = None,
+        token_budget: int = 6000,
+        download_concurrency: int = 8,
+        extract_concurrency: int = 4,
+        summarize_concurrency: int = 4,
+        summary_batch_size: int = 8,
+    ):
         self.source_client = source_client
         self.summarizer_llm = summarizer_llm
+        self.summary_cache = summary_cache
+        self.system_prompt = SUMMARIZER_SYSTEM_PROMPT
+        self.summarizer = Summarizer(
+            summarizer_llm, system_prompt=self.system_prompt, token_budget=token_budget
+        )
+        self.download_concurrency = download_concurrency
+        self.extract_concurrency = extract_concurrency
+        self.summarize_concurrency = summarize_concurrency
+        # Abstract-depth papers summarized per LLM request; 1 disables batching
+        self.summary_batch_size = max(1, summary_batch_size)
 
-    async def execute(self, plan: SearchPlan) -> List[PaperResult]:
+    async def execute(
+        self, plan: SearchPlan, paper_metas: Optional[List[PaperMeta]] = None
+    ) -> List[PaperResult]:
         """Executes the given search plan and returns a list of paper results."""
+        results = [result async for result in self.execute_stream(plan, paper_metas)]
+        return sorted(results, key=lambda result: result.rank)
+
+    async def execute_stream(
+        self, plan: SearchPlan, paper_metas: Optional[List[PaperMeta]] = None
+    ) -> AsyncIterator[PaperResult]:
+        """
+        Executes the given search plan, yielding each paper result as soon as it
+        is ready. Results arrive in completion order; `PaperResult.rank` holds the
+        paper's position in the search results.
+
+        Args:
+            plan: The plan to execute.
+            paper_metas: Search results already fetched for this plan (e.g. by a
+                speculative search); skips the search step when given.
+        """
         logger.info(f"Executing plan: {plan.model_dump_json(indent=2)}")
 
-        # 1. Fetch paper metadata from the source client
-        paper_metas = await self.source_client.search_papers(plan)
+        # 1. Fetch paper metadata from the source client, unless already known
+        if paper_metas is None and plan.intent == "summarize_ids":
+            paper_metas = await self._fetch_by_ids(plan.arxiv_ids)
+        elif paper_metas is None:
+            paper_metas = await self.source_client.search_papers(plan)
 
-        results: List[PaperResult] = []
         if not plan.summarization.enabled:
             # If summarization is disabled, just return the metadata
-            for meta in paper_metas:
-                results.append(PaperResult(meta=meta))
-            return results
+            for rank, meta in enumerate(paper_metas):
+                yield PaperResult(meta=meta, rank=rank)
+            return
+
+        # 2. If summarization is enabled, run the papers through the pipeline
+        finished: asyncio.Queue = asyncio.Queue()
 
-        # 2. If summarization is enabled, process papers concurrently
-        tasks = [self._process_paper(meta) for meta in paper_metas]
-        processed_results = await asyncio.gather(*tasks)
-        return [res for res in processed_results if res is not None]
+        def emit(rank: int, result: PaperResult) -> None:
+            result.rank = rank
+            finished.put_nowait(result)
 
-    async def _process_paper(self, meta) -> PaperResult:
-        """Helper to process a single paper: download, read, and summarize."""
+        pipeline = asyncio.create_task(self._run_pipeline(paper_metas, plan, emit))
+        # Wake the consumer once the pipeline is done, even if it failed
+        pipeline.add_done_callback(lambda _: finished.put_nowait(None))
         try:
-            # Read the full paper content
-            content = await self.source_client.read_paper(meta.arxiv_id)
+            while (result := await finished.get()) is not None:
+                yield result
+            await pipeline
+        finally:
+            # The consumer stopped early; don't leave work running in the background
+            if not pipeline.done():
+                pipeline.cancel()
 
-            # Summarize the content
-            summary = await self._summarize_content(content)
+    async def _fetch_by_ids(self, arxiv_ids: List[str]) -> List[PaperMeta]:
+        """Fetches metadata for the requested papers in one batch, in request order."""
+        found: Dict[str, PaperMeta] = {}
+        for meta in await self.source_client.fetch_papers(arxiv_ids):
+            found[meta.arxiv_id] = meta
+            # Unversioned requests match the latest version arXiv returns
+            found.setdefault(split_arxiv_id(meta.arxiv_id)[0], meta)
+        missing = [arxiv_id for arxiv_id in arxiv_ids if arxiv_id not in found]
+        if missing:
+            logger.warning(f"Could not find papers for arXiv IDs: {', '.join(missing)}")
+        return [found[arxiv_id] for arxiv_id in arxiv_ids if arxiv_id in found]
 
-            return PaperResult(meta=meta, content=content, summary=summary)
-        except Exception as e:
-            logger.error(f"Failed to process paper {meta.arxiv_id}: {e}")
-            # Return metadata-only result on failure
-            return PaperResult(meta=meta)
+    async def _run_pipeline(
+        self,
+        metas: List[PaperMeta],
+        plan: SearchPlan,
+        emit: Callable[[int, PaperResult], None],
+    ) -> None:
+        """
+        Runs papers through the download -> extract -> summarize stages, calling
+        `emit(rank, result)` as each paper finishes. Papers whose summary is cached
+        skip the pipeline, abstract-depth papers go straight to summarization, and
+        a paper that fails at any stage is emitted as a metadata-only result.
+        """
+        depth = plan.summarization.depth
+        download_queue: asyncio.Queue = asyncio.Queue(self.download_concurrency)
+        extract_queue: asyncio.Queue = asyncio.Queue(self.extract_concurrency)
+        summarize_queue: asyncio.Queue = asyncio.Queue(self.summarize_concurrency)
 
-    async def _summarize_content(self, content: PaperContentSections) -> PaperSummary:
-        """Summarizes the given content using the summarizer LLM."""
-        # In a real application, this prompt would be more sophisticated and live in `prompts.py`.
-        system_prompt = (
-            "You are a research assistant. Your task is to summarize a paper's abstract."
-            "Analyze the text and provide a summary in the following JSON format:\n"
-            "{\n"
-            '    "tldr": ["A one-sentence summary."],\n'
-            '    "problem": "What problem is the paper trying to solve?",\n'
-            '    "method": "What method does the paper propose?",\n'
-            '    "results": "What are the key results?",\n'
-            '    "limitations": "What are the limitations of the work?",\n'
-            '    "future_work": "What are the suggestions for future work?",\n'
-            '    "raw_markdown": "A markdown-formatted summary."\n'
-            "}\n"
-        )
+        async def feed() -> None:
+            abstracts: List[_PaperJob] = []
+            for rank, meta in enumerate(metas):
+                # Serve cached summaries before doing any download or LLM work
+                cache_key = self._summary_cache_key(meta, plan)
+                if cache_key is not None:
+                    cached = await asyncio.to_thread(self.summary_cache.get, cache_key)
+                    if cached is not None:
+                        emit(rank, PaperResult(meta=meta, summary=cached))
+                        continue
+                job = _PaperJob(rank, meta, cache_key)
+                if depth == "abstract" and meta.abstract:
+                    # The search already returned the abstract; skip the PDF entirely
+                    # and summarize several abstracts per LLM request.
+                    job.content = self._content_from_meta(meta)
+                    abstracts.append(job)
+                    if len(abstracts) == self.summary_batch_size:
+                        await summarize_queue.put(abstracts)
+                        abstracts = []
+                    continue
+                await download_queue.put([job])
+            if abstracts:
+                await summarize_queue.put(abstracts)
+            for _ in range(self.download_concurrency):
+                await download_queue.put(_END_OF_STAGE)
 
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": content.full_text},
-        ]
+        async def download(batch: List[_PaperJob]) -> List[_PaperJob]:
+            for job in batch:
+                await self.source_client.prefetch_paper(job.meta, depth=depth)
+            return batch
 
-        response_text = await self.summarizer_llm.chat(messages)
+        async def extract(batch: List[_PaperJob]) -> List[_PaperJob]:
+            for job in batch:
+                # Read the paper content, reusing the metadata we already have
+                job.content = await self.source_client.read_paper_from_meta(
+                    job.meta, depth=depth
+                )
+            return batch
+
+        async def summarize(batch: List[_PaperJob]) -> None:
+            with record_answering_providers() as answered:
+                if len(batch) > 1:
+                    texts = [self._build_summary_input(j.content, depth) for j in batch]
+                    summaries = await self.summarizer.summarize_batch(
+                        texts, max_batch_size=self.summary_batch_size
+                    )
+                else:
+                    content = batch[0].content
+                    summaries = [await self._summarize_content(content, depth)]
+            # The cache key names the primary summarizer; don't file a fallback
+            # provider's summaries under it.
+            primary = (self.summarizer_llm.provider, self.summarizer_llm.model)
+            cacheable = answered <= {primary}
+            for job, summary in zip(batch, summaries, strict=True):
+                # Don't cache the fallback produced when the LLM returned invalid JSON
+                if cacheable and job.cache_key is not None and summary.problem != "N/A":
+                    await asyncio.to_thread(
+                        self.summary_cache.put, job.cache_key, summary
+                    )
+                emit(
+                    job.rank,
+                    PaperResult(meta=job.meta, content=job.content, summary=summary),
+                )
+
+        # A TaskGroup, so an unexpected error in one stage (e.g. from the summary
+        # cache) cancels the others instead of leaving them blocked on their queues.
         try:
-            # Use regex to find the JSON block, even with markdown fences
-            match = re.search(r"```json\n({.*?})\n```|({.*?})", response_text, re.DOTALL)
-            if not match:
-                raise json.JSONDecodeError("No JSON object found in response", response_text, 0)
-            
-            # Extract the first non-empty group
-            json_str = next(g for g in match.groups() if g)
-            summary_json = json.loads(json_str)
-            return PaperSummary.model_validate(summary_json)
-        except (json.JSONDecodeError, TypeError) as e:
-            # If the LLM fails to produce valid JSON, we fall back to a raw summary.
-            return PaperSummary(
-                tldr=["LLM failed to produce a valid JSON summary."],
-                problem="N/A",
-                method="N/A",
-                results="N/A",
-                limitations="N/A",
-                future_work="N/A",
-                raw_markdown=response_text,
-            )
+            async with asyncio.TaskGroup() as group:
+                group.create_task(feed())
+                group.create_task(
+                    self._run_stage(
+                        download, download_queue, self.download_concurrency,
+                        extract_queue, self.extract_concurrency, emit,
+                    )
+                )
+                group.create_task(
+                    self._run_stage(
+                        extract, extract_queue, self.extract_concurrency,
+                        summarize_queue, self.summarize_concurrency, emit,
+                    )
+                )
+                group.create_task(
+                    self._run_stage(
+                        summarize, summarize_queue, self.summarize_concurrency,
+                        None, 0, emit,
+                    )
+                )
+        except ExceptionGroup as e:
+            raise _first_error(e) from e
+
+    async def _run_stage(
+        self,
+        handler: Callable[[List[_PaperJob]], Awaitable[Optional[List[_PaperJob]]]],
+        inbox: asyncio.Queue,
+        workers: int,
+        outbox: Optional[asyncio.Queue],
+        downstream_workers: int,
+        emit: Callable[[int, PaperResult], None],
+    ) -> None:
+        """
+        Runs `workers` copies of a stage until its input is exhausted. Queue items
+        are batches of papers; a batch usually holds a single paper.
+        """
+
+        async def worker() -> None:
+            while (batch := await inbox.get()) is not _END_OF_STAGE:
+                try:
+                    batch = await handler(batch)
+                except Exception as e:
+                    for job in batch:
+                        logger.error(
+                            f"Failed to process paper {job.meta.arxiv_id}: {e}"
+                        )
+                        # Return metadata-only result on failure
+                        emit(job.rank, PaperResult(meta=job.meta))
+                    continue
+                if outbox is not None:
+                    await outbox.put(batch)
+
+        async with asyncio.TaskGroup() as group:
+            for _ in range(workers):
+                group.create_task(worker())
+        if outbox is not None:
+            for _ in range(downstream_workers):
+                await outbox.put(_END_OF_STAGE)
+
+    def _summary_cache_key(self, meta: PaperMeta, plan: SearchPlan) -> Optional[str]:
+        """Builds the summary cache key for a paper, or None if caching is off."""
+        if self.summary_cache is None:
+            return None
+        return SummaryCache.make_key(
+            meta.arxiv_id,
+            self.summarizer_llm.provider,
+            self.summarizer_llm.model,
+            plan.summarization.depth,
+            prompt_hash(self.system_prompt),
+        )
+
+    async def _summarize_content(
+        self,
+        content: PaperContentSections,
+        depth: DepthType = "full",
+    ) -> PaperSummary:
+        """Summarizes the given content using the summarizer LLM."""
+        summary_input = self._build_summary_input(content, depth)
+        return await self.summarizer.summarize(summary_input)
+
+    def _content_from_meta(self, meta: PaperMeta) -> PaperContentSections:
+        """Content for abstract-depth summaries, built from the search metadata."""
+        return PaperContentSections(full_text=meta.abstract, abstract=meta.abstract)
+
+    def _build_summary_input(
+        self, content: PaperContentSections, depth: DepthType
+    ) -> str:
+        """
+        Builds the LLM input from only the sections the summarization depth asks for,
+        falling back to the full text when the paper could not be segmented.
+        """
+        wanted = [("Abstract", content.abstract)]
+        if depth in ("abstract+intro+conclusion", "full"):
+            wanted.append(("Introduction", content.introduction))
+        if depth == "full":
+            wanted += [("Methods", content.methods), ("Results", content.results)]
+            wanted += list(content.other_sections.items())
+        if depth in ("abstract+intro+conclusion", "full"):
+            wanted.append(("Conclusion", content.conclusion))
+
+        found = [(title, body) for title, body in wanted if body]
+        if depth != "abstract" and all(title == "Abstract" for title, _ in found):
+            return content.full_text
+        sections = "\n\n".join(f"## {title}\n{body}" for title, body in found)
+        return sections or content.full_text
 
 
 class PaperAgent:
     """
     High-level agent that orchestrates planning and execution.
+
+    In speculative mode, a search guessed from the raw query by the rule-based
+    grammar runs while the planner is still working. Its results are used if the
+    final plan searches for the same thing, and discarded otherwise.
     """
 
-    def __init__(self, planner: QueryPlanner, executor: PlanExecutor):
+    def __init__(
+        self,
+        planner: QueryPlanner,
+        executor: PlanExecutor,
+        speculative: bool = False,
+        speculation_min_confidence: float = 0.5,
+    ):
+        """
+        Initializes the PaperAgent.
+
+        Args:
+            planner: Turns raw queries into SearchPlans.
+            executor: Executes SearchPlans.
+            speculative: Overlap a heuristic search with planning.
+            speculation_min_confidence: Minimum rule-based parse score worth
+                speculating on. Misses still spend arXiv rate-limit budget, so
+                low-confidence guesses are not attempted.
+        """
         self.planner = planner
         self.executor = executor
+        self.speculative = speculative
+        self.speculation_min_confidence = speculation_min_confidence
+        self.speculation_stats = CacheStats()
+        self._speculation_rules: Optional[RuleBasedPlanner] = None
 
     async def run(self, raw_query: str) -> Tuple[SearchPlan, List[PaperResult]]:
         """
@@ -121,12 +376,119 @@ class PaperAgent:
             A tuple containing the generated SearchPlan and the list of PaperResults.
         """
         logger.info(f"Received query: '{raw_query}'")
-        # 1. Create a plan
-        plan = await self.planner.plan(raw_query)
+        # 1. Create a plan, possibly searching speculatively in the meantime
+        plan, paper_metas = await self._plan_and_search(raw_query)
         logger.info("Plan created successfully.")
 
         # 2. Execute the plan
-        results = await self.executor.execute(plan)
+        results = await self.executor.execute(plan, paper_metas)
         logger.info(f"Execution finished. Found {len(results)} results.")
 
         return plan, results
+
+    async def run_stream(
+        self,
+        raw_query: str,
+        on_plan: Optional[Callable[[SearchPlan], None]] = None,
+    ) -> AsyncIterator[PaperResult]:
+        """
+        Like `run`, but yields each PaperResult as soon as it is ready.
+
+        Args:
+            raw_query: The natural language query.
+            on_plan: Called with the generated SearchPlan before execution starts.
+        """
+        logger.info(f"Received query: '{raw_query}'")
+        plan, paper_metas = await self._plan_and_search(raw_query)
+        logger.info("Plan created successfully.")
+        if on_plan is not None:
+            on_plan(plan)
+
+        found = 0
+        async for result in self.executor.execute_stream(plan, paper_metas):
+            found += 1
+            yield result
+        logger.info(f"Execution finished. Found {found} results.")
+
+    async def _plan(self, raw_query: str) -> SearchPlan:
+        """
+        Plans a query. Queries naming papers by arXiv ID or URL skip the planner
+        LLM and the topic search, and fetch exactly those papers.
+        """
+        arxiv_ids = find_arxiv_ids(raw_query)
+        if arxiv_ids:
+            logger.info(f"Found arXiv IDs in query: {', '.join(arxiv_ids)}")
+            return self.planner.plan_for_ids(raw_query, arxiv_ids)
+        return await self.planner.plan(raw_query)
+
+    async def _plan_and_search(
+        self, raw_query: str
+    ) -> Tuple[SearchPlan, Optional[List[PaperMeta]]]:
+        """
+        Plans a query and returns the plan together with its search results, if a
+        speculative search already produced them; otherwise with None.
+        """
+        guess = self._speculate(raw_query)
+        if guess is None:
+            return await self._plan(raw_query), None
+
+        source_client = self.executor.source_client
+        guessed_plan, search = guess
+        try:
+            plan = await self._plan(raw_query)
+        except BaseException:
+            search.cancel()
+            raise
+
+        hit = plan.intent == "search_papers" and (
+            source_client.search_key(plan) == source_client.search_key(guessed_plan)
+        )
+        paper_metas = None
+        if hit:
+            try:
+                paper_metas = await search
+            except Exception as e:
+                logger.warning(f"Speculative search failed ({e}); searching again.")
+                hit = False
+        else:
+            search.cancel()
+
+        if hit:
+            self.speculation_stats.hits += 1
+        else:
+            self.speculation_stats.misses += 1
+        logger.info(
+            f"Speculative search {'hit' if hit else 'missed'} "
+            f"(hit rate {self.speculation_stats.hit_rate:.0%})."
+        )
+        return plan, paper_metas
+
+    def _speculate(
+        self, raw_query: str
+    ) -> Optional[Tuple[SearchPlan, "asyncio.Task[List[PaperMeta]]"]]:
+        """Starts a search for the plan guessed from the raw query, if any."""
+        if not self.speculative or find_arxiv_ids(raw_query):
+            return None
+        if self._speculation_rules is None:
+            self._speculation_rules = self.planner.rules or RuleBasedPlanner()
+        guessed_plan, confidence = self._speculation_rules.parse(raw_query)
+        if guessed_plan is None or confidence < self.speculation_min_confidence:
+            return None
+        search = asyncio.create_task(
+            self.executor.source_client.search_papers(guessed_plan)
+        )
+        # Don't warn about an exception nobody retrieves after a miss
+        search.add_done_callback(lambda task: task.cancelled() or task.exception())
+        return guessed_plan, search
+
+    async def aclose(self) -> None:
+        """Releases resources (e.g. pooled HTTP connections) held by the executor."""
+        await self.executor.source_client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
@@ -0,0 +1,89 @@
+from typing import Optional
+
+from summx.cache import PlanCache, SummaryCache
+from summx.config import SummXConfig
+from summx.llm import HedgedLLMClient, LLMClient, Provider, get_llm
+from summx.sources import get_source_client
+
+from .executor import PaperAgent, PlanExecutor
+from .planner import QueryPlanner, RuleBasedPlanner
+
+
+def build_agent(
+    config: SummXConfig,
+    planner_provider: Optional[Provider] = None,
+    summarizer_provider: Optional[Provider] = None,
+) -> PaperAgent:
+    """
+    Builds a fully wired PaperAgent (LLMs, source client and caches) from the config.
+
+    Args:
+        config: The application configuration.
+        planner_provider: Overrides `config.planner_provider` if given.
+        summarizer_provider: Overrides `config.summarizer_provider` if given.
+    """
+    planner_llm = _hedged_llm(
+        planner_provider or config.planner_provider,
+        config.planner_fallback_provider,
+        config,
+    )
+    summarizer_llm = _hedged_llm(
+        summarizer_provider or config.summarizer_provider,
+        config.summarizer_fallback_provider,
+        config,
+    )
+    source_client = get_source_client(config=config)
+
+    summary_cache = None
+    if config.summary_cache_enabled:
+        summary_cache = SummaryCache(
+            config.cache_dir / "summaries.sqlite3",
+            ttl_seconds=config.summary_cache_ttl_hours * 3600,
+            max_entries=config.summary_cache_max_entries,
+        )
+
+    plan_cache = None
+    if config.plan_cache_enabled:
+        plan_cache = PlanCache(
+            max_entries=config.plan_cache_max_entries,
+            path=config.cache_dir / "plans.sqlite3"
+            if config.plan_cache_persistent
+            else None,
+        )
+
+    rules = None
+    if config.rule_planner_enabled:
+        rules = RuleBasedPlanner(min_confidence=config.rule_planner_min_confidence)
+
+    planner = QueryPlanner(llm=planner_llm, cache=plan_cache, rules=rules)
+    executor = PlanExecutor(
+        source_client=source_client,
+        summarizer_llm=summarizer_llm,
+        summary_cache=summary_cache,
+        token_budget=config.summarizer_token_budget,
+        download_concurrency=config.pipeline_download_concurrency,
+        extract_concurrency=config.pipeline_extract_concurrency,
+        summarize_concurrency=config.pipeline_summarize_concurrency,
+        summary_batch_size=config.summary_batch_size,
+    )
+    return PaperAgent(
+        planner=planner,
+        executor=executor,
+        speculative=config.speculative_search,
+        speculation_min_confidence=config.speculative_search_min_confidence,
+    )
+
+
+def _hedged_llm(
+    provider: Provider, fallback_provider: Optional[Provider], config: SummXConfig
+) -> LLMClient:
+    """Wraps a provider (and its optional fallback) with timeouts and hedging."""
+    clients = [get_llm(provider=provider, config=config)]
+    if fallback_provider and fallback_provider != provider:
+        clients.append(get_llm(provider=fallback_provider, config=config))
+    return HedgedLLMClient(
+        clients,
+        timeout=config.llm_timeout,
+        hedge_percentile=config.llm_hedge_percentile,
+        initial_hedge_delay=config.llm_hedge_initial_delay,
+    )
@@ -1,24 +1,226 @@
+import asyncio
 import json
-from typing import Dict, List
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
 
-from summx.llm import LLMClient
-from summx.models import SearchPlan
+from summx.cache import CacheStats, PlanCache
+from summx.cache.plan_cache import NUMBER_WORDS
+from summx.llm import LLMClient, loads_tolerant
+from summx.models import SearchFilters, SearchPlan, SummarizationConfig
 from summx.prompts import QUERY_PLANNER_SYSTEM_PROMPT
 
+logger = logging.getLogger(__name__)
+
+# Phrases that turn summarization off, whichever planner produced the plan.
+DISABLE_SUMMARY_PHRASES = [
+    "don't summarize",
+    "do not summarize",
+    "no summary",
+    "without summarizing",
+]
+
+# re.VERBOSE ignores literal spaces, so those in "a few" etc. are spelled \s+.
+_COUNT = "|".join(
+    [r"\d+"] + [re.escape(word).replace(r"\ ", r"\s+") for word in NUMBER_WORDS]
+)
+_QUERY_SHAPE = re.compile(
+    rf"""^(?:(?:please\s+)?(?:show|find|get|list|give|fetch|search\s+for)(?:\s+me)?\s+)?
+    (?:the\s+)?(?P<top>top\s+)?(?:(?P<count>{_COUNT})\b)?\s*
+    (?P<sort>most\s+recent|latest|newest|recent|most\s+relevant|relevant|best)?\s*
+    (?:papers|paper|articles|preprints)\b(?P<rest>.*)$""",
+    re.IGNORECASE | re.VERBOSE,
+)
+_CLAUSE = re.compile(
+    r"\b(on|about|regarding|by|from|since|in|between)\b", re.IGNORECASE
+)
+_YEAR = r"(?:19|20)\d{2}"
+_YEAR_RANGE = re.compile(rf"({_YEAR})\s*(?:to|-|until|and)\s*({_YEAR})")
+_DISABLE_SUMMARY = re.compile(
+    "|".join(
+        rf"\b{re.escape(phrase)}(?:\s+them)?\b" for phrase in DISABLE_SUMMARY_PHRASES
+    ),
+    re.IGNORECASE,
+)
+_DEPTH_PHRASES = {
+    "abstract": re.compile(
+        r"\b(?:abstracts?\s+only|(?:only|just)\s+(?:the\s+)?abstracts?)\b",
+        re.IGNORECASE,
+    ),
+    "full": re.compile(
+        r"\b(?:with\s+)?(?:an?\s+)?(?:detailed|full|in[-\s]depth)\s+summar(?:y|ies)\b",
+        re.IGNORECASE,
+    ),
+}
+# Words suggesting logic the rules can't express; leave those queries to the LLM.
+_HARD_WORDS = re.compile(
+    r"\b(?:not|except|excluding|but|or|similar|compare|versus|vs)\b", re.IGNORECASE
+)
+_NAME_PARTICLES = {
+    "van", "von", "de", "der", "den", "da", "di", "du", "del", "la", "le"
+}
+_MAX_TOPIC_WORDS = 8
+# Confidence lost each time a clause keyword had to be read as part of the topic.
+_AMBIGUITY_PENALTY = 0.15
+# Clause keywords that may also join the words of a topic ("learning on graphs").
+_TOPIC_CONTINUATIONS = {"on", "in", "for"}
+# Relative dates and publication verbs; a topic containing them is really a date
+# filter the rules can't express, e.g. "GNNs published this week".
+_NOT_TOPIC_WORDS = re.compile(
+    r"\b(?:last|this|past|next|ago|today|yesterday|recent|recently|latest|"
+    r"days?|weeks?|months?|years?|published|submitted|released|posted|appeared)\b",
+    re.IGNORECASE,
+)
+
+
+class RuleBasedPlanner:
+    """
+    Deterministic planner for the common query shapes, such as "five most recent
+    papers on hyper graphs" or "papers by Laszlo Lovasz from 2022".
+
+    Queries are matched against a small grammar and scored; `plan` only returns a
+    SearchPlan when the score reaches `min_confidence`, so anything unusual still
+    goes to the LLM planner.
+    """
+
+    def __init__(self, min_confidence: float = 0.8):
+        """
+        Initializes the RuleBasedPlanner.
+
+        Args:
+            min_confidence: Score between 0 and 1 a parse needs to be used.
+        """
+        self.min_confidence = min_confidence
+        self.stats = CacheStats()
+
+    def plan(self, raw_query: str) -> Optional[SearchPlan]:
+        """Returns a SearchPlan if the query is parsed confidently, else None."""
+        plan, confidence = self.parse(raw_query)
+        if plan is None or confidence < self.min_confidence:
+            self.stats.misses += 1
+            logger.debug(
+                f"Rule planner declined '{raw_query}' (confidence {confidence:.2f})."
+            )
+            return None
+        self.stats.hits += 1
+        return plan
+
+    def parse(self, raw_query: str) -> Tuple[Optional[SearchPlan], float]:
+        """Parses a query into a SearchPlan and a confidence score."""
+        query = re.sub(r"\s+", " ", raw_query).strip(" ?!.")
+        summarization = SummarizationConfig()
+        query, disabled = _DISABLE_SUMMARY.subn("", query)
+        summarization.enabled = not disabled
+        for depth, pattern in _DEPTH_PHRASES.items():
+            query, found = pattern.subn("", query)
+            if found:
+                summarization.depth = depth
+
+        match = _QUERY_SHAPE.match(query.strip(" ,"))
+        if match is None or _HARD_WORDS.search(query):
+            return None, 0.0
+
+        filters = SearchFilters()
+        confidence = 1.0
+        last_clause = None
+        parts = _CLAUSE.split(match.group("rest").strip(" ,"))
+        if parts[0].strip():
+            return None, 0.0  # Words between "papers" and the first clause
+        for keyword, value in zip(parts[1::2], parts[2::2], strict=True):
+            keyword, value = keyword.lower(), value.strip(" ,")
+            if keyword in ("on", "about", "regarding") and not filters.topic and value:
+                filters.topic, last_clause = value, "topic"
+            elif keyword == "by" and not filters.author and _looks_like_name(value):
+                filters.author, last_clause = value, "author"
+            elif keyword in ("from", "in", "between", "since") and _set_dates(
+                filters, keyword, value
+            ):
+                last_clause = "date"
+            elif keyword in _TOPIC_CONTINUATIONS and last_clause == "topic" and value:
+                # e.g. "learning on graphs" or "attention in transformers"
+                filters.topic = f"{filters.topic} {keyword} {value}"
+                confidence -= _AMBIGUITY_PENALTY
+            else:
+                # e.g. "from last month" or "by someone": leave it to the LLM
+                return None, 0.0
+
+        if not filters.topic and not filters.author:
+            return None, 0.0
+        if filters.topic and _NOT_TOPIC_WORDS.search(filters.topic):
+            return None, 0.0
+        if filters.topic and len(filters.topic.split()) > _MAX_TOPIC_WORDS:
+            confidence -= 0.3
+
+        sort_word = (match.group("sort") or "").lower()
+        if "recent" in sort_word or sort_word in ("latest", "newest"):
+            sort = "most_recent"
+        elif sort_word or match.group("top"):
+            sort = "relevance"
+        else:
+            sort = "most_recent"
+
+        plan = SearchPlan(
+            filters=filters,
+            sort=sort,
+            summarization=summarization,
+            raw_query=raw_query,
+        )
+        count = match.group("count")
+        if count:
+            count = " ".join(count.lower().split())
+            plan.limit = int(NUMBER_WORDS.get(count, count))
+            if plan.limit < 1:
+                return None, 0.0
+        return plan, max(confidence, 0.0)
+
+
+def _looks_like_name(value: str) -> bool:
+    """True for capitalized names of one to four words, e.g. "Laszlo Lovasz"."""
+    words = value.split()
+    return 0 < len(words) <= 4 and all(
+        word.lower() in _NAME_PARTICLES
+        or (word[0].isupper() and not any(char.isdigit() for char in word))
+        for word in words
+    )
+
+
+def _set_dates(filters: SearchFilters, keyword: str, value: str) -> bool:
+    """Sets the date filters from a year or year-range clause, if `value` is one."""
+    year_range = _YEAR_RANGE.fullmatch(value)
+    if year_range and keyword in ("from", "between"):
+        filters.date_from = f"{year_range.group(1)}-01-01"
+        filters.date_to = f"{year_range.group(2)}-12-31"
+        return True
+    if not re.fullmatch(_YEAR, value) or keyword == "between":
+        return False
+    filters.date_from = f"{value}-01-01"
+    if keyword != "since":
+        filters.date_to = f"{value}-12-31"
+    return True
+
 
 class QueryPlanner:
     """
     Converts a natural-language user query into a structured SearchPlan using an LLM.
     """
 
-    def __init__(self, llm: LLMClient):
+    def __init__(
+        self,
+        llm: LLMClient,
+        cache: Optional[PlanCache] = None,
+        rules: Optional[RuleBasedPlanner] = None,
+    ):
         """
         Initializes the QueryPlanner with an LLM client.
 
         Args:
             llm: An instance of a class that inherits from LLMClient.
+            cache: Optional plan cache consulted before calling the LLM.
+            rules: Optional rule-based planner tried before the cache and the LLM.
         """
         self.llm = llm
+        self.cache = cache
+        self.rules = rules
 
     async def plan(self, raw_query: str) -> SearchPlan:
         """
@@ -30,31 +232,73 @@ class QueryPlanner:
         Returns:
             A SearchPlan object.
         """
+        if self.rules is not None:
+            planned = self.rules.plan(raw_query)
+            if planned is not None:
+                return self._apply_overrides(planned, raw_query)
+
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.get, raw_query)
+            if cached is not None:
+                cached.raw_query = raw_query
+                return self._apply_overrides(cached, raw_query)
+
         messages: List[Dict[str, str]] = [
             {"role": "system", "content": QUERY_PLANNER_SYSTEM_PROMPT},
             {"role": "user", "content": raw_query},
         ]
 
         try:
-            response_text = await self.llm.chat(messages)
-            # The prompt asks for a raw JSON object, so we parse it directly.
-            plan_json = json.loads(response_text)
+            response_text = await self.llm.chat_structured(messages, SearchPlan)
+            # Structured output makes valid JSON likely, but repair it if needed.
+            plan_json = loads_tolerant(response_text)
+            if not isinstance(plan_json, dict):
+                kind = type(plan_json).__name__
+                raise TypeError(f"Expected a JSON object, got {kind}")
             # Add the original query to the plan for traceability
             plan_json["raw_query"] = raw_query
             plan = SearchPlan.model_validate(plan_json)
 
-            # --- Business Logic Override ---
-            # Ensure summarization is enabled by default, unless the user explicitly asks not to.
-            # This makes the agent more helpful and predictable.
-            disable_phrases = ["don't summarize", "do not summarize", "no summary", "without summarizing"]
-            if not any(phrase in raw_query.lower() for phrase in disable_phrases):
-                plan.summarization.enabled = True
-            else:
-                plan.summarization.enabled = False
+            if self.cache is not None:
+                await asyncio.to_thread(self.cache.put, raw_query, plan)
 
-            return plan
+            return self._apply_overrides(plan, raw_query)
         except (json.JSONDecodeError, TypeError) as e:
             # Handle cases where the LLM output is not valid JSON
-            raise ValueError(f"Failed to parse LLM response into a valid plan: {e}") from e
+            raise ValueError(
+                f"Failed to parse LLM response into a valid plan: {e}"
+            ) from e
         except Exception as e:
-            raise RuntimeError(f"An unexpected error occurred during planning: {e}") from e
+            raise RuntimeError(
+                f"An unexpected error occurred during planning: {e}"
+            ) from e
+
+    def plan_for_ids(self, raw_query: str, arxiv_ids: List[str]) -> SearchPlan:
+        """
+        Builds a "summarize_ids" plan for a query that names papers by arXiv ID,
+        without consulting the LLM.
+
+        Args:
+            raw_query: The user's natural language query.
+            arxiv_ids: The arXiv IDs found in the query.
+        """
+        plan = SearchPlan(
+            intent="summarize_ids",
+            arxiv_ids=list(arxiv_ids),
+            limit=len(arxiv_ids),
+            raw_query=raw_query,
+        )
+        return self._apply_overrides(plan, raw_query)
+
+    def _apply_overrides(self, plan: SearchPlan, raw_query: str) -> SearchPlan:
+        """Applies query-specific business rules to a new or cached plan."""
+        # --- Business Logic Override ---
+        # Ensure summarization is enabled by default, unless the user explicitly asks
+        # not to.
+        # This makes the agent more helpful and predictable.
+        if not any(phrase in raw_query.lower() for phrase in DISABLE_SUMMARY_PHRASES):
+            plan.summarization.enabled = True
+        else:
+            plan.summarization.enabled = False
+
+        return plan
@@ -0,0 +1,271 @@
+import asyncio
+import json
+import logging
+import math
+import re
+from typing import Dict, List, Optional
+
+from pydantic import ValidationError
+
+from summx.llm import LLMClient, loads_tolerant
+from summx.models import PaperSummary
+from summx.prompts import (
+    SUMMARIZER_BATCH_PROMPT,
+    SUMMARIZER_CHUNK_PROMPT,
+    SUMMARIZER_SYSTEM_PROMPT,
+)
+
+logger = logging.getLogger(__name__)
+
+# A rough average for English text with BPE tokenizers.
+CHARS_PER_TOKEN = 4
+# Never shrink a chunk below this, however long the system prompt is; smaller
+# chunks would multiply the number of map requests for little gain.
+MIN_CHUNK_TOKENS = 1024
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheaply estimates the number of tokens in `text`, without a tokenizer."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def chunk_text(text: str, max_tokens: int) -> List[str]:
+    """
+    Splits `text` into chunks of at most roughly `max_tokens` tokens, preferring
+    paragraph boundaries, then line boundaries, then hard cuts.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    chunks: List[str] = []
+    current = ""
+    for piece in _split_pieces(text, max_chars):
+        if current and len(current) + len(piece) > max_chars:
+            chunks.append(current)
+            current = ""
+        current += piece
+    if current.strip():
+        chunks.append(current)
+    return chunks
+
+
+def _split_pieces(text: str, max_chars: int) -> List[str]:
+    pieces = []
+    for paragraph in re.split(r"(?<=\n\n)", text):
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+            continue
+        for line in paragraph.splitlines(keepends=True):
+            pieces.extend(
+                line[start:start + max_chars]
+                for start in range(0, len(line), max_chars)
+            )
+    return pieces
+
+
+def parse_summary(response_text: str) -> PaperSummary:
+    """
+    Parses an LLM response into a PaperSummary, repairing malformed JSON where
+    possible and falling back to a raw summary (with "N/A" fields) otherwise.
+    """
+    try:
+        summary_json = loads_tolerant(response_text)
+        return PaperSummary.model_validate(summary_json)
+    except (json.JSONDecodeError, ValidationError):
+        # If the LLM fails to produce valid JSON, we fall back to a raw summary.
+        return PaperSummary(
+            tldr=["LLM failed to produce a valid JSON summary."],
+            problem="N/A",
+            method="N/A",
+            results="N/A",
+            limitations="N/A",
+            future_work="N/A",
+            raw_markdown=response_text,
+        )
+
+
+def parse_batch_summaries(
+    response_text: str, keys: List[str]
+) -> Dict[str, PaperSummary]:
+    """
+    Parses a batched LLM response (a JSON array of summaries keyed by "id") into
+    PaperSummary objects. Entries that are missing, unknown or invalid are left
+    out, so callers can retry just those papers.
+    """
+    try:
+        items = loads_tolerant(response_text)
+    except json.JSONDecodeError:
+        return {}
+    if isinstance(items, dict):
+        # Unwrap {"summaries": [...]}-style responses
+        items = next((value for value in items.values() if isinstance(value, list)), [])
+    if not isinstance(items, list):
+        return {}
+
+    summaries: Dict[str, PaperSummary] = {}
+    for item in items:
+        if not isinstance(item, dict) or str(item.get("id")) not in keys:
+            continue
+        try:
+            summaries[str(item["id"])] = PaperSummary.model_validate(item)
+        except ValidationError:
+            continue
+    return summaries
+
+
+class Summarizer:
+    """
+    Summarizes paper text within a token budget.
+
+    Text that fits the budget is summarized with a single request. Longer text is
+    split into chunks that are summarized concurrently (map), and the resulting
+    notes are combined into the final structured summary (reduce), so latency is
+    bounded by the slowest chunk rather than by the paper's length.
+    """
+
+    def __init__(
+        self,
+        llm: LLMClient,
+        system_prompt: str = SUMMARIZER_SYSTEM_PROMPT,
+        token_budget: int = 6000,
+        max_concurrency: int = 4,
+    ):
+        """
+        Initializes the Summarizer.
+
+        Args:
+            llm: The LLM used for every map and reduce request.
+            system_prompt: Prompt for the final, structured summary.
+            token_budget: Maximum input tokens per request.
+            max_concurrency: Maximum number of chunk requests in flight per paper.
+        """
+        self.llm = llm
+        self.system_prompt = system_prompt
+        self.token_budget = token_budget
+        self.max_concurrency = max_concurrency
+
+    async def summarize(self, text: str) -> PaperSummary:
+        """
+        Summarizes `text` into a PaperSummary, first reducing it to notes if it
+        does not fit a single request of `token_budget` tokens.
+        """
+        budget = self._content_budget(self.token_budget, self.system_prompt)
+        if estimate_tokens(text) > budget:
+            text = await self._reduce_to_budget(text, self.token_budget)
+
+        messages = [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": text},
+        ]
+        return parse_summary(await self.llm.chat_structured(messages, PaperSummary))
+
+    async def summarize_batch(
+        self,
+        texts: List[str],
+        max_batch_size: int = 8,
+    ) -> List[PaperSummary]:
+        """
+        Summarizes several short texts (e.g. abstracts) with as few requests as
+        possible, packing up to `max_batch_size` of them into each request.
+
+        Every paper is keyed in the request and the response is a keyed JSON array.
+        Papers missing from, or malformed in, a batched response are summarized
+        with their own request.
+
+        Args:
+            texts: The paper contents to summarize.
+            max_batch_size: Maximum number of papers per request.
+
+        Returns:
+            One summary per text, in the same order.
+        """
+        budget = self._content_budget(self.token_budget, SUMMARIZER_BATCH_PROMPT)
+        summaries: List[Optional[PaperSummary]] = [None] * len(texts)
+
+        async def summarize_group(indexes: List[int]) -> None:
+            if len(indexes) == 1:
+                return  # Handled by the single-paper path below
+            keys = [f"P{n + 1}" for n in range(len(indexes))]
+            papers = "\n\n".join(
+                f"### Paper {key}\n{texts[i]}"
+                for key, i in zip(keys, indexes, strict=True)
+            )
+            messages = [
+                {"role": "system", "content": SUMMARIZER_BATCH_PROMPT},
+                {"role": "user", "content": papers},
+            ]
+            try:
+                response = await self.llm.chat(messages)
+            except Exception as e:
+                # Leave the slots empty; each paper is then summarized on its own
+                logger.warning(f"Batched summary of {len(indexes)} papers failed: {e}")
+                return
+            parsed = parse_batch_summaries(response, keys)
+            for key, i in zip(keys, indexes, strict=True):
+                summaries[i] = parsed.get(key)
+
+        groups = self._pack(texts, budget, max_batch_size)
+        await asyncio.gather(*(summarize_group(group) for group in groups))
+
+        leftover = [i for i, summary in enumerate(summaries) if summary is None]
+        if leftover and len(leftover) < len(texts):
+            logger.info(
+                f"Summarizing {len(leftover)} papers missing from a batch one by one."
+            )
+        singles = await asyncio.gather(*(self.summarize(texts[i]) for i in leftover))
+        for i, summary in zip(leftover, singles, strict=True):
+            summaries[i] = summary
+        return summaries
+
+    @staticmethod
+    def _pack(texts: List[str], budget: int, max_batch_size: int) -> List[List[int]]:
+        """Groups text indexes, in order, into batches that fit `budget` tokens."""
+        groups: List[List[int]] = []
+        used = 0
+        for i, text in enumerate(texts):
+            tokens = estimate_tokens(text)
+            if groups and len(groups[-1]) < max_batch_size and used + tokens <= budget:
+                groups[-1].append(i)
+                used += tokens
+            else:
+                groups.append([i])
+                used = tokens
+        return groups
+
+    async def _reduce_to_budget(self, text: str, max_tokens: int) -> str:
+        """Map chunks of `text` to notes until the notes fit the final request."""
+        final_budget = self._content_budget(max_tokens, self.system_prompt)
+        chunk_budget = self._content_budget(max_tokens, SUMMARIZER_CHUNK_PROMPT)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def summarize_chunk(index: int, total: int, chunk: str) -> str:
+            async with semaphore:
+                messages = [
+                    {"role": "system", "content": SUMMARIZER_CHUNK_PROMPT},
+                    {
+                        "role": "user",
+                        "content": f"Part {index + 1} of {total}:\n\n{chunk}",
+                    },
+                ]
+                return await self.llm.chat(messages)
+
+        while estimate_tokens(text) > final_budget:
+            chunks = chunk_text(text, chunk_budget)
+            logger.info(f"Summarizing {len(chunks)} chunks of a long paper.")
+            notes = await asyncio.gather(
+                *(
+                    summarize_chunk(i, len(chunks), chunk)
+                    for i, chunk in enumerate(chunks)
+                )
+            )
+            reduced = "\n\n".join(
+                f"## Notes on part {i + 1}\n{note.strip()}"
+                for i, note in enumerate(notes)
+            )
+            if len(chunks) == 1 or len(reduced) >= len(text):
+                # The notes are not getting shorter; stop rather than loop forever.
+                return reduced
+            text = reduced
+        return text
+
+    @staticmethod
+    def _content_budget(max_tokens: int, system_prompt: str) -> int:
+        return max(max_tokens - estimate_tokens(system_prompt), MIN_CHUNK_TOKENS)
@@ -0,0 +1,22 @@
+"""
+Caches that let SummX avoid repeating network, parsing and LLM work.
+"""
+
+from .base import CacheStats, SqliteCache
+from .content_store import ContentStore
+from .pdf_store import PdfStore
+from .plan_cache import PlanCache, normalize_query
+from .search_cache import SearchCache
+from .summary_cache import SummaryCache, prompt_hash
+
+__all__ = [
+    "CacheStats",
+    "SqliteCache",
+    "ContentStore",
+    "PdfStore",
+    "PlanCache",
+    "normalize_query",
+    "SearchCache",
+    "SummaryCache",
+    "prompt_hash",
+]
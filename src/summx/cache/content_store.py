@@ -0,0 +1,105 @@
+import time
+import zlib
+from pathlib import Path
+from typing import Optional
+
+from summx.models.paper import PaperContentSections
+from summx.utils import split_arxiv_id
+
+from .base import SqliteCache
+
+
+class ContentStore(SqliteCache):
+    """
+    A persistent store of extracted `PaperContentSections`.
+
+    Entries are keyed by arXiv ID, version, extractor version and extraction mode,
+    and stored as zlib-compressed JSON. Bumping the extractor version naturally
+    bypasses old entries, and `invalidate_extractor` removes everything produced by
+    a given extractor release in one statement.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sections (
+            arxiv_id TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            extractor_version TEXT NOT NULL,
+            mode TEXT NOT NULL,
+            payload BLOB NOT NULL,
+            created_at REAL NOT NULL,
+            PRIMARY KEY (arxiv_id, version, extractor_version, mode)
+        );
+    """
+
+    def __init__(self, path: Path, compression_level: int = 6):
+        """
+        Initializes the ContentStore.
+
+        Args:
+            path: Path of the SQLite database file; created if missing.
+            compression_level: zlib compression level for stored payloads.
+        """
+        self.compression_level = compression_level
+        super().__init__(path)
+
+    def contains(
+        self, arxiv_id: str, extractor_version: str, mode: str = "full"
+    ) -> bool:
+        """Checks whether content is stored, without affecting stats."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM sections WHERE arxiv_id = ? AND version = ? "
+                "AND extractor_version = ? AND mode = ?",
+                (*self._key(arxiv_id), extractor_version, mode),
+            ).fetchone()
+        return row is not None
+
+    def get(
+        self, arxiv_id: str, extractor_version: str, mode: str = "full"
+    ) -> Optional[PaperContentSections]:
+        """Returns the stored sections for a paper, or None on a miss."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM sections WHERE arxiv_id = ? AND version = ? "
+                "AND extractor_version = ? AND mode = ?",
+                (*self._key(arxiv_id), extractor_version, mode),
+            ).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return PaperContentSections.model_validate_json(zlib.decompress(row[0]))
+
+    def put(
+        self,
+        arxiv_id: str,
+        extractor_version: str,
+        content: PaperContentSections,
+        mode: str = "full",
+    ) -> None:
+        """Stores the extracted sections for a paper."""
+        payload = zlib.compress(
+            content.model_dump_json().encode("utf-8"), self.compression_level
+        )
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sections "
+                "(arxiv_id, version, extractor_version, mode, payload, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (*self._key(arxiv_id), extractor_version, mode, payload, time.time()),
+            )
+
+    def invalidate_extractor(self, extractor_version: str) -> int:
+        """Deletes every entry produced by the given extractor version."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM sections WHERE extractor_version = ?",
+                (extractor_version,),
+            )
+        return cursor.rowcount
+
+    @staticmethod
+    def _key(arxiv_id: str):
+        base_id, version = split_arxiv_id(arxiv_id)
+        # arXiv versions start at 1, so 0 stands for "unversioned".
+        return base_id, version or 0
@@ -0,0 +1,116 @@
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+from summx.utils import split_arxiv_id
+
+from .base import CacheStats
+
+logger = logging.getLogger(__name__)
+
+
+class PdfStore:
+    """
+    A persistent, size-capped on-disk store of downloaded PDFs.
+
+    Files are addressed by arXiv ID and version, so a given key always refers to the
+    same bytes. Writes are atomic (temp file + rename) and the least recently used
+    files are evicted once the store grows past `max_bytes`. Recency is tracked via
+    file modification times, so it survives process restarts.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = 2 * 1024**3):
+        """
+        Initializes the PdfStore.
+
+        Args:
+            root: Directory in which PDFs are stored; created if missing.
+            max_bytes: Total size above which least recently used PDFs are evicted.
+        """
+        self.root = Path(root).expanduser()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def path_for(self, arxiv_id: str) -> Path:
+        """Returns the path at which the PDF for `arxiv_id` is (or would be) stored."""
+        base_id, version = split_arxiv_id(arxiv_id)
+        # Old-style IDs such as "hep-th/9901001" contain a slash.
+        name = base_id.replace("/", "_")
+        if version is not None:
+            name += f"v{version}"
+        return self.root / f"{name}.pdf"
+
+    def contains(self, arxiv_id: str) -> bool:
+        """Checks whether `arxiv_id` is stored, without affecting stats or recency."""
+        return self.path_for(arxiv_id).exists()
+
+    def get(self, arxiv_id: str) -> Optional[Path]:
+        """Returns the cached PDF path for `arxiv_id`, or None on a miss."""
+        path = self.path_for(arxiv_id)
+        try:
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return path
+
+    def put(self, arxiv_id: str, data: bytes) -> Path:
+        """Atomically stores the PDF bytes for `arxiv_id` and returns its path."""
+        with self.writer(arxiv_id) as f:
+            f.write(data)
+        path = self.path_for(arxiv_id)
+        self.evict(keep=path)
+        return path
+
+    @contextmanager
+    def writer(self, arxiv_id: str) -> Iterator[BinaryIO]:
+        """
+        Opens a file for streaming a PDF into the store.
+
+        The data goes to a temporary file that is only renamed into place when the
+        block exits cleanly, so readers never see a partially written PDF. Unlike
+        `put`, it does not evict: call `evict` afterwards, in a worker thread when
+        running on an event loop, since it scans the whole store.
+        """
+        path = self.path_for(arxiv_id)
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """Removes least recently used PDFs until the store fits within `max_bytes`."""
+        with self._lock:
+            entries = []
+            for path in self.root.glob("*.pdf"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                path.unlink(missing_ok=True)
+                total -= size
+                self.stats.evictions += 1
+                logger.debug(f"Evicted cached PDF {path.name}")
+
+    def size_bytes(self) -> int:
+        """Returns the total size of the PDFs currently in the store."""
+        return sum(path.stat().st_size for path in self.root.glob("*.pdf"))
@@ -0,0 +1,139 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from summx.models.plan import SearchPlan
+
+from .base import CacheStats, SqliteCache
+
+NUMBER_WORDS = {
+    "one": "1",
+    "two": "2",
+    "three": "3",
+    "four": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8",
+    "nine": "9",
+    "ten": "10",
+    "eleven": "11",
+    "twelve": "12",
+    "fifteen": "15",
+    "twenty": "20",
+    "a dozen": "12",
+    "a couple of": "2",
+    "a few": "3",
+}
+
+# Phrasings that the planner maps to the same plan.
+PHRASE_SYNONYMS = {
+    "most recent": "recent",
+    "latest": "recent",
+    "newest": "recent",
+    "most relevant": "relevant",
+}
+
+
+def normalize_query(raw_query: str) -> str:
+    """
+    Normalizes a query for plan caching: lowercases it, collapses whitespace and
+    punctuation, spells numbers as digits and folds common synonyms, so that
+    "Five most recent papers on GNNs!" and "5 recent papers on gnns" share a key.
+    """
+    query = raw_query.lower()
+    # Keep + and # so that e.g. "C++" and "C#" stay different topics
+    query = re.sub(r"[^\w\s'\-.:/+#]", " ", query)
+    query = re.sub(r"\s+", " ", query).strip(" .")
+    for phrase, replacement in {**NUMBER_WORDS, **PHRASE_SYNONYMS}.items():
+        query = re.sub(rf"\b{re.escape(phrase)}\b", replacement, query)
+    return query
+
+
+class _PersistentPlanStore(SqliteCache):
+    """SQLite tier of the plan cache."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS plans (
+            key TEXT PRIMARY KEY,
+            payload TEXT NOT NULL,
+            created_at REAL NOT NULL
+        );
+    """
+
+    def get(self, key: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM plans WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, payload: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO plans (key, payload, created_at) "
+                "VALUES (?, ?, ?)",
+                (key, payload, time.time()),
+            )
+
+
+class PlanCache:
+    """
+    A two-tier cache of SearchPlans keyed by normalized query.
+
+    Lookups hit an in-process LRU first and then, if configured, a persistent SQLite
+    tier shared across runs. Cached plans are returned without `raw_query`-specific
+    adjustments; callers re-apply those after a hit.
+    """
+
+    def __init__(self, max_entries: int = 256, path: Optional[Path] = None):
+        """
+        Initializes the PlanCache.
+
+        Args:
+            max_entries: Size of the in-process LRU tier.
+            path: Optional SQLite file for the persistent tier.
+        """
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._store = _PersistentPlanStore(path) if path is not None else None
+
+    def get(self, raw_query: str) -> Optional[SearchPlan]:
+        """Returns a copy of the cached plan for the query, or None on a miss."""
+        key = normalize_query(raw_query)
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+
+        if payload is None and self._store is not None:
+            payload = self._store.get(key)
+            if payload is not None:
+                self._remember(key, payload)
+
+        if payload is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return SearchPlan.model_validate_json(payload)
+
+    def put(self, raw_query: str, plan: SearchPlan) -> None:
+        """Caches the plan under the normalized form of the query."""
+        key = normalize_query(raw_query)
+        payload = plan.model_dump_json()
+        self._remember(key, payload)
+        if self._store is not None:
+            self._store.put(key, payload)
+
+    def _remember(self, key: str, payload: str) -> None:
+        with self._lock:
+            self._memory[key] = payload
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self.stats.evictions += 1
@@ -0,0 +1,86 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, List, Optional, Tuple
+
+from summx.models.paper import PaperMeta
+from summx.models.plan import SortType
+
+from .base import CacheStats
+
+
+@dataclass
+class _SearchEntry:
+    results: List[PaperMeta]
+    stored_at: float
+    ttl: float
+
+
+class SearchCache:
+    """
+    An in-process TTL cache of search results.
+
+    `most_recent` searches change as new papers are submitted, so they get a short
+    TTL; `relevance` searches get a longer one. Once an entry's TTL has passed it may
+    still be served as *stale* for up to `max_stale` seconds, giving the caller the
+    chance to refresh it in the background instead of blocking on the network.
+    """
+
+    def __init__(
+        self,
+        most_recent_ttl: float = 300,
+        relevance_ttl: float = 3600,
+        max_stale: float = 3600,
+        max_entries: int = 512,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes the SearchCache.
+
+        Args:
+            most_recent_ttl: Seconds a `most_recent` result stays fresh.
+            relevance_ttl: Seconds a `relevance` result stays fresh.
+            max_stale: Seconds past its TTL that an entry may still be served stale.
+            max_entries: Number of entries above which the oldest are evicted.
+            clock: Monotonic time source, injectable for testing.
+        """
+        self.ttls = {"most_recent": most_recent_ttl, "relevance": relevance_ttl}
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, _SearchEntry]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Tuple[List[PaperMeta], bool]]:
+        """
+        Returns `(results, is_stale)` for the key, or None if it is missing or too
+        stale to serve.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        age = self.clock() - entry.stored_at
+        if age > entry.ttl + self.max_stale:
+            del self._entries[key]
+            self.stats.evictions += 1
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        # Hand out copies so callers can annotate results (e.g. local_pdf_path).
+        return [meta.model_copy() for meta in entry.results], age > entry.ttl
+
+    def put(self, key: Hashable, sort: SortType, results: List[PaperMeta]) -> None:
+        """Stores fresh results for the key."""
+        self._entries[key] = _SearchEntry(
+            results=[meta.model_copy() for meta in results],
+            stored_at=self.clock(),
+            ttl=self.ttls[sort],
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
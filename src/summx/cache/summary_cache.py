@@ -0,0 +1,109 @@
+import hashlib
+import time
+from pathlib import Path
+from typing import Optional
+
+from summx.models.paper import PaperSummary
+from summx.utils import split_arxiv_id
+
+from .base import SqliteCache
+
+
+def prompt_hash(prompt: str) -> str:
+    """Returns a short, stable fingerprint of a prompt for use in cache keys."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+
+
+class SummaryCache(SqliteCache):
+    """
+    A persistent cache of paper summaries.
+
+    Entries are keyed by (arXiv ID + version, provider, model, depth, prompt hash),
+    expire after `ttl_seconds`, and the least recently used entries are evicted once
+    there are more than `max_entries`.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS summaries (
+            key TEXT PRIMARY KEY,
+            payload TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            last_access REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS summaries_last_access ON summaries (last_access);
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: Optional[float] = 7 * 24 * 3600,
+        max_entries: int = 10_000,
+    ):
+        """
+        Initializes the SummaryCache.
+
+        Args:
+            path: Path of the SQLite database file; created if missing.
+            ttl_seconds: Age after which entries expire; None disables expiry.
+            max_entries: Number of entries above which the least recently used
+                ones are evicted.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        super().__init__(path)
+
+    @staticmethod
+    def make_key(
+        arxiv_id: str, provider: str, model: str, depth: str, prompt_digest: str
+    ) -> str:
+        """Builds the cache key for a summary."""
+        base_id, version = split_arxiv_id(arxiv_id)
+        return "|".join(
+            [f"{base_id}v{version or 0}", provider, model, depth, prompt_digest]
+        )
+
+    def get(self, key: str) -> Optional[PaperSummary]:
+        """Returns the cached summary for `key`, or None if missing or expired."""
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload, created_at FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self._is_expired(row[1], now):
+                conn.execute("DELETE FROM summaries WHERE key = ?", (key,))
+                self.stats.evictions += 1
+                row = None
+            if row is not None:
+                conn.execute(
+                    "UPDATE summaries SET last_access = ? WHERE key = ?", (now, key)
+                )
+        if row is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return PaperSummary.model_validate_json(row[0])
+
+    def put(self, key: str, summary: PaperSummary) -> None:
+        """Stores a summary, evicting the least recently used entries if needed."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries "
+                "(key, payload, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, summary.model_dump_json(), now, now),
+            )
+            if self.ttl_seconds is not None:
+                cursor = conn.execute(
+                    "DELETE FROM summaries WHERE created_at < ?",
+                    (now - self.ttl_seconds,),
+                )
+                self.stats.evictions += cursor.rowcount
+            cursor = conn.execute(
+                "DELETE FROM summaries WHERE key IN (SELECT key FROM summaries "
+                "ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self.stats.evictions += cursor.rowcount
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
@@ -3,17 +3,16 @@ import logging
 import os
 import subprocess
 from pathlib import Path
-from typing import List
+from typing import Annotated, Optional
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from summx.agent import PaperAgent, PlanExecutor, QueryPlanner
+# The agent (LLM SDKs, arXiv, PyMuPDF) is imported lazily inside the commands that
+# need it, so `summx query --server ...` starts fast.
 from summx.config import load_config
-from summx.llm import get_llm
-from summx.sources import get_source_client
 from summx.models import PaperResult, SearchPlan
 
 # --- Manual .env loading (Workaround) ---
@@ -42,31 +41,31 @@ logging.basicConfig(
 )
 
 
-def _print_results(plan: SearchPlan, results: List[PaperResult]):
-    """Prints the final results in a structured format using Rich."""
+def _print_plan(plan: SearchPlan):
+    """Prints the search plan header using Rich."""
     console.print(Panel(f"[bold]Query:[/] {plan.raw_query}", title="Search Plan", border_style="green"))
 
-    if not results:
-        console.print("[yellow]No papers found matching your query.[/yellow]")
-        return
-
-    for i, result in enumerate(results):
-        meta = result.meta
-        title_text = f"{i + 1}. {meta.title}"
-        author_text = f"[italic]by {', '.join(meta.authors)}[/italic]"
-        meta_text = f"Published: {meta.published} | ArXiv ID: {meta.arxiv_id}"
-
-        summary_panel = ""
-        console.print(Panel(
-            f"[bold cyan]{title_text}[/bold cyan]\n{author_text}\n{meta_text}",
-            title=f"Result {i+1}",
-            border_style="magenta",
-            expand=True
-        ))
-        if result.summary:
-            summary_text = result.summary.raw_markdown
-            summary_panel = Panel(summary_text, title="Summary", border_style="blue", expand=True)
-            console.print(summary_panel)
+
+def _print_result(result: PaperResult):
+    """Prints a single paper result in a structured format using Rich."""
+    meta = result.meta
+    number = result.rank + 1
+    title_text = f"{number}. {meta.title}"
+    author_text = f"[italic]by {', '.join(meta.authors)}[/italic]"
+    meta_text = f"Published: {meta.published} | ArXiv ID: {meta.arxiv_id}"
+
+    console.print(Panel(
+        f"[bold cyan]{title_text}[/bold cyan]\n{author_text}\n{meta_text}",
+        title=f"Result {number}",
+        border_style="magenta",
+        expand=True
+    ))
+    if result.summary:
+        summary_text = result.summary.raw_markdown
+        summary_panel = Panel(
+            summary_text, title="Summary", border_style="blue", expand=True
+        )
+        console.print(summary_panel)
 
 
 async def _run_agent(query: str):
@@ -74,6 +73,7 @@ async def _run_agent(query: str):
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
+        console=console,
         transient=True,
     ) as progress:
         try:
@@ -82,37 +82,117 @@ async def _run_agent(query: str):
 
             # 1. Set up all dependencies
             progress.add_task("Initializing LLMs and clients...", total=None)
-            planner_llm = get_llm(provider=config.planner_provider, config=config)
-            summarizer_llm = get_llm(provider=config.summarizer_provider, config=config)
-
-            source_client = get_source_client(config=config)
-
-            planner = QueryPlanner(llm=planner_llm)
-            executor = PlanExecutor(
-                source_client=source_client, summarizer_llm=summarizer_llm
-            )
+            from summx.agent import build_agent
 
-            agent = PaperAgent(planner=planner, executor=executor)
+            agent = build_agent(config)
 
-            # 2. Run the agent
-            progress.add_task(f"Running query: '{query}'...", total=None)
-            plan, results = await agent.run(query)
+            # 2. Run the agent, printing each paper as soon as it is ready and
+            # closing its pooled connections afterwards
+            async with agent:
+                progress.add_task(f"Running query: '{query}'...", total=None)
+                found = 0
+                async for result in agent.run_stream(query, on_plan=_print_plan):
+                    _print_result(result)
+                    found += 1
 
         except Exception as e:
             console.print(f"[bold red]An error occurred:[/] {e}")
             console.print_exception(show_locals=True)
             raise typer.Exit(code=1)
 
-    # 3. Print results outside the progress bar context
-    _print_results(plan, results)
+    if not found:
+        console.print("[yellow]No papers found matching your query.[/yellow]")
+
+
+async def _run_remote(query: str, server: str):
+    """Runs the query on a `summx serve` daemon, printing results as they arrive."""
+    from summx.client import stream_query
+
+    found = 0
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+    ) as progress:
+        try:
+            progress.add_task(f"Running query on {server}: '{query}'...", total=None)
+            async for event in stream_query(server, query):
+                if "plan" in event:
+                    _print_plan(SearchPlan.model_validate(event["plan"]))
+                elif "result" in event:
+                    _print_result(PaperResult.model_validate(event["result"]))
+                    found += 1
+        except Exception as e:
+            console.print(f"[bold red]An error occurred:[/] {e}")
+            raise typer.Exit(code=1) from None
+
+    if not found:
+        console.print("[yellow]No papers found matching your query.[/yellow]")
 
 
 @app.command(name="query")
-def run_query(query: str = typer.Argument(..., help="The natural language query to search for papers.")):
+def run_query(
+    query: str = typer.Argument(
+        ..., help="The natural language query to search for papers."
+    ),
+    server: Optional[str] = typer.Option(
+        None,
+        "--server",
+        envvar="SUMMX_SERVER",
+        help="Send the query to a running `summx serve` daemon, e.g. "
+        "http://127.0.0.1:8765 or unix:/path/to/summx.sock.",
+    ),
+):
     """
     Search for and summarize academic papers based on a query.
     """
-    asyncio.run(_run_agent(query))
+    if server:
+        asyncio.run(_run_remote(query, server))
+    else:
+        asyncio.run(_run_agent(query))
+
+
+async def _serve(host: str, port: int, unix_socket: Optional[Path]):
+    """Builds the agent once and serves queries until interrupted."""
+    from summx.agent import build_agent
+    from summx.server import SummXServer
+
+    config = load_config()
+    async with build_agent(config) as agent:
+        server = SummXServer(
+            agent, max_concurrent_queries=config.server_max_concurrent_queries
+        )
+        await server.serve(host=host, port=port, unix_socket=unix_socket)
+
+
+@app.command()
+def serve(
+    host: Annotated[
+        Optional[str], typer.Option(help="Interface to listen on.")
+    ] = None,
+    port: Annotated[
+        Optional[int], typer.Option(help="TCP port to listen on.")
+    ] = None,
+    socket: Annotated[
+        Optional[Path],
+        typer.Option(help="Listen on this Unix socket instead of a TCP port."),
+    ] = None,
+):
+    """
+    Runs a long-lived daemon that keeps the agent, connections and caches warm,
+    and serves queries over a local HTTP API.
+    """
+    config = load_config()
+    host = host or config.server_host
+    port = port or config.server_port
+    socket = socket or config.server_socket
+    address = f"unix:{socket}" if socket else f"http://{host}:{port}"
+    console.print(f"[green]Serving SummX on {address}[/green] (Ctrl+C to stop)")
+    try:
+        asyncio.run(_serve(host, port, socket))
+    except KeyboardInterrupt:
+        console.print("Stopped.")
 
 
 @app.command()
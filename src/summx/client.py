@@ -0,0 +1,50 @@
+"""
+Thin client for a running `summx serve` daemon.
+
+Only depends on httpx and the pydantic models, so it starts quickly: no LLM SDKs,
+arXiv or PDF libraries are imported.
+"""
+
+import json
+from typing import AsyncIterator, Dict, Tuple
+
+import httpx
+
+UNIX_PREFIX = "unix:"
+
+
+def _client_for(server: str) -> Tuple[httpx.AsyncClient, str]:
+    """Builds an HTTP client for "http://host:port" or "unix:/path/to.sock"."""
+    # Queries can take minutes; only bound how long connecting may take.
+    timeout = httpx.Timeout(None, connect=5.0)
+    if server.startswith(UNIX_PREFIX):
+        transport = httpx.AsyncHTTPTransport(uds=server[len(UNIX_PREFIX):])
+        return httpx.AsyncClient(transport=transport, timeout=timeout), "http://summx"
+    return httpx.AsyncClient(timeout=timeout), server.rstrip("/")
+
+
+async def stream_query(server: str, query: str) -> AsyncIterator[Dict]:
+    """
+    Sends a query to the daemon and yields its events ({"plan": ...},
+    {"result": ...}, {"done": ...}) as they arrive.
+
+    Raises:
+        RuntimeError: If the server rejects the query or reports an error.
+    """
+    client, base_url = _client_for(server)
+    async with client:
+        async with client.stream(
+            "POST", f"{base_url}/query", json={"query": query}
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise RuntimeError(
+                    f"SummX server error {response.status_code}: {response.text}"
+                )
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                if "error" in event:
+                    raise RuntimeError(f"SummX server error: {event['error']}")
+                yield event
@@ -18,15 +18,87 @@ class SummXConfig(BaseSettings):
 
     # --- Paper Source Configuration ---
     paper_source: Literal["api", "mcp"] = "api"
+    # "httpx" searches asynchronously; "arxiv" forces the `arxiv` package fallback
+    arxiv_search_backend: Literal["httpx", "arxiv"] = "httpx"
     # The following are for the optional MCP backend
     mcp_arxiv_command: Optional[str] = None
     mcp_arxiv_storage_path: Optional[Path] = None
 
+    # --- HTTP Connection Pool ---
+    http_timeout: float = 30.0
+    http_max_connections: int = 10
+    http_max_keepalive_connections: int = 5
+    http_keepalive_expiry: float = 30.0
+    http2: bool = False  # Requires the optional `h2` package
+
+    # --- Rate Limiting & Retries ---
+    # arXiv asks for no more than one API request every three seconds
+    arxiv_api_rate: float = 1 / 3  # Requests per second
+    arxiv_api_burst: int = 1
+    pdf_download_rate: float = 1.0
+    pdf_download_burst: int = 4
+    http_max_retries: int = 4
+    http_backoff_base: float = 1.0  # Seconds; doubled on every retry, with jitter
+    http_backoff_max: float = 30.0
+    http_max_retry_after: float = 120.0  # Longer Retry-After waits fail instead
+
+    # --- PDF Extraction ---
+    extraction_workers: Optional[int] = None  # None = CPU count, 0 = use a thread
+    extraction_max_tasks_per_child: Optional[int] = 50
+
+    # --- Caching ---
+    cache_dir: Path = Path.home() / ".cache" / "summx"
+    pdf_cache_enabled: bool = True
+    pdf_cache_max_mb: int = 2048
+    content_cache_enabled: bool = True
+    summary_cache_enabled: bool = True
+    summary_cache_ttl_hours: float = 7 * 24
+    summary_cache_max_entries: int = 10_000
+    plan_cache_enabled: bool = True
+    plan_cache_max_entries: int = 256
+    plan_cache_persistent: bool = True
+    search_cache_enabled: bool = True
+    search_cache_most_recent_ttl: float = 300  # seconds
+    search_cache_relevance_ttl: float = 3600
+    # How long past its TTL a result may still be served
+    search_cache_max_stale: float = 3600
+
+    # --- Planner ---
+    # Plan simple, common query shapes with regex rules instead of the LLM
+    rule_planner_enabled: bool = True
+    rule_planner_min_confidence: float = 0.8
+    # Run a search guessed from the raw query while the planner LLM is working
+    speculative_search: bool = False
+    speculative_search_min_confidence: float = 0.5
+
     # --- Default LLM Models ---
     planner_provider: str = "openai"
     planner_model: str = "gpt-4o-mini"
     summarizer_provider: str = "groq"
     summarizer_model: str = "llama-3.1-8b-instant"
+    # Optional second providers, raced against slow calls and used on failure
+    planner_fallback_provider: Optional[str] = None
+    summarizer_fallback_provider: Optional[str] = None
+    llm_timeout: float = 60.0  # Seconds per provider call
+    # Hedge once a call is slower than this percentile of recent latencies
+    llm_hedge_percentile: float = 0.95
+    llm_hedge_initial_delay: float = 5.0  # Used until enough latencies are known
+    # Input tokens per summarizer request; longer papers are chunked (map-reduce)
+    summarizer_token_budget: int = 6000
+
+    # --- Execution Pipeline ---
+    # Papers handled concurrently by each download -> extract -> summarize stage
+    pipeline_download_concurrency: int = 8
+    pipeline_extract_concurrency: int = 4
+    pipeline_summarize_concurrency: int = 4
+    # Abstract-depth papers packed into one summarizer request; 1 disables batching
+    summary_batch_size: int = 8
+
+    # --- Daemon (`summx serve`) ---
+    server_host: str = "127.0.0.1"
+    server_port: int = 8765
+    server_socket: Optional[Path] = None  # Listen on a Unix socket instead
+    server_max_concurrent_queries: int = 8
 
     model_config = ConfigDict(
         case_sensitive=False,
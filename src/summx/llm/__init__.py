@@ -1,6 +1,8 @@
 from .base import LLMClient, Provider, get_llm, DummyLLMClient
 from .groq_client import GroqClient
 from .openai_client import OpenAIClient
+from .hedged import HedgedLLMClient, record_answering_providers
+from .json_repair import loads_tolerant
 
 __all__ = [
     "LLMClient",
@@ -9,4 +11,7 @@ __all__ = [
     "DummyLLMClient",
     "OpenAIClient",
     "GroqClient",
+    "HedgedLLMClient",
+    "record_answering_providers",
+    "loads_tolerant",
 ]
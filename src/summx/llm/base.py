@@ -1,5 +1,8 @@
+import re
 from abc import ABC, abstractmethod
-from typing import Dict, List, Literal, Optional
+from typing import AsyncIterator, Dict, List, Literal, Optional, Type
+
+from pydantic import BaseModel
 
 from summx.config import SummXConfig
 
@@ -9,21 +12,54 @@ Provider = Literal["openai", "groq", "dummy"]
 class LLMClient(ABC):
     """Abstract base class for all LLM provider clients."""
 
+    # Identify the backend, e.g. for cache keys. Subclasses should override these.
+    provider: str = "unknown"
+    model: str = "unknown"
+
     @abstractmethod
     async def chat(self, messages: List[Dict[str, str]]) -> str:
         """Sends a chat request to the LLM and returns the string response."""
         pass
 
+    async def chat_stream(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """
+        Sends a chat request to the LLM and yields the response in pieces as it is
+        generated. Closing the iterator early cancels the generation.
+
+        Clients without a streaming mode yield the complete response at once.
+        """
+        yield await self.chat(messages)
+
+    async def chat_structured(
+        self, messages: List[Dict[str, str]], schema: Type[BaseModel]
+    ) -> str:
+        """
+        Sends a chat request whose response should be a JSON object matching
+        `schema`, using the provider's JSON or schema-constrained output mode where
+        available. Returns the raw response text; parse it with `loads_tolerant`.
+
+        Clients without such a mode fall back to a plain chat request.
+        """
+        return await self.chat(messages)
+
 
 class DummyLLMClient(LLMClient):
     """A dummy LLM client for testing that returns a canned response."""
 
+    provider = "dummy"
+    model = "dummy"
+
     def __init__(self, response: str = "This is a dummy response."):
         self.response = response
 
     async def chat(self, messages: List[Dict[str, str]]) -> str:
         return self.response
 
+    async def chat_stream(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        # Stream word by word, keeping whitespace, to mimic a real provider.
+        for piece in re.findall(r"\s*\S+\s*", self.response) or [self.response]:
+            yield piece
+
 
 def get_llm(
     provider: Provider,
@@ -1,6 +1,7 @@
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List, Type
 
 from groq import AsyncGroq
+from pydantic import BaseModel
 
 from .base import LLMClient
 
@@ -8,6 +9,8 @@ from .base import LLMClient
 class GroqClient(LLMClient):
     """LLM client for the Groq API."""
 
+    provider = "groq"
+
     def __init__(self, api_key: str, model: str):
         self.api_key = api_key
         self.model = model
@@ -26,3 +29,45 @@ class GroqClient(LLMClient):
             return content
         except Exception as e:
             raise RuntimeError(f"Error calling Groq API: {e}") from e
+
+    async def chat_structured(
+        self, messages: List[Dict[str, str]], schema: Type[BaseModel]
+    ) -> str:
+        """
+        Sends a chat request using the Groq API's JSON output mode.
+        Groq's JSON mode guarantees a JSON object; the schema itself is conveyed
+        by the prompt.
+        """
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,  # type: ignore
+                response_format={"type": "json_object"},  # type: ignore
+            )
+            content = response.choices[0].message.content
+            if content is None:
+                raise ValueError("Received null content from Groq API.")
+            return content
+        except Exception as e:
+            raise RuntimeError(f"Error calling Groq API: {e}") from e
+
+    async def chat_stream(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Streams a chat response from the Groq API as it is generated."""
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,  # type: ignore
+                stream=True,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Error calling Groq API: {e}") from e
+
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise RuntimeError(f"Error streaming from Groq API: {e}") from e
+        finally:
+            # Stops the generation server-side if the caller stopped reading early
+            await stream.close()
@@ -0,0 +1,252 @@
+import asyncio
+import logging
+import statistics
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+from pydantic import BaseModel
+
+from .base import LLMClient
+
+logger = logging.getLogger(__name__)
+
+# (provider, model) of each client that answered a hedged call in this context.
+_answered_by: ContextVar[Optional[Set[Tuple[str, str]]]] = ContextVar(
+    "answered_by", default=None
+)
+
+
+@contextmanager
+def record_answering_providers() -> Iterator[Set[Tuple[str, str]]]:
+    """
+    Collects the (provider, model) of every client that answers a hedged call made
+    inside the block, including calls from tasks started within it.
+
+    Lets callers tell answers from a fallback provider apart from the primary's,
+    e.g. to avoid caching them under the primary's key.
+    """
+    answered: Set[Tuple[str, str]] = set()
+    token = _answered_by.set(answered)
+    try:
+        yield answered
+    finally:
+        _answered_by.reset(token)
+
+
+def _record_answer(client: LLMClient) -> None:
+    answered = _answered_by.get()
+    if answered is not None:
+        answered.add((client.provider, client.model))
+
+
+class _LatencyWindow:
+    """Recent latencies of one client, used for routing and hedging decisions."""
+
+    def __init__(self, size: int):
+        self.samples: Deque[float] = deque(maxlen=size)
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def median(self) -> float:
+        return statistics.median(self.samples) if self.samples else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(fraction * len(ordered)))
+        return ordered[index]
+
+
+class HedgedLLMClient(LLMClient):
+    """
+    An LLMClient that spreads requests over several providers.
+
+    - Every call is bounded by `timeout`.
+    - Requests go to the provider with the lowest recent median latency; providers
+      that have not answered yet are tried first, so every provider gets measured.
+    - If the chosen provider has not answered once its latency percentile
+      `hedge_percentile` has passed, the request is also sent to the next provider.
+      The first good answer wins and the other request is cancelled.
+    - Errors and timeouts fail over to the next provider straight away; they count
+      as a full timeout in the latency statistics, which demotes the provider.
+
+    `provider` and `model` report the first configured client. Use
+    `record_answering_providers` to find out which provider actually answered.
+    """
+
+    def __init__(
+        self,
+        clients: List[LLMClient],
+        timeout: float = 60.0,
+        hedge_percentile: float = 0.95,
+        initial_hedge_delay: float = 5.0,
+        min_samples: int = 10,
+        window: int = 100,
+    ):
+        """
+        Initializes the HedgedLLMClient.
+
+        Args:
+            clients: The providers to use, in order of preference.
+            timeout: Maximum seconds a single provider call may take.
+            hedge_percentile: Latency percentile (0-1) after which a hedge request
+                is sent to the next provider.
+            initial_hedge_delay: Hedge delay used until a provider has `min_samples`
+                recorded latencies.
+            min_samples: Latencies needed before the percentile is trusted.
+            window: Number of recent latencies kept per provider.
+        """
+        if not clients:
+            raise ValueError("HedgedLLMClient needs at least one client.")
+        self.clients = clients
+        self.provider = clients[0].provider
+        self.model = clients[0].model
+        self.timeout = timeout
+        self.hedge_percentile = hedge_percentile
+        self.initial_hedge_delay = initial_hedge_delay
+        self.min_samples = min_samples
+        self.latencies: Dict[int, _LatencyWindow] = {
+            id(client): _LatencyWindow(window) for client in clients
+        }
+        self.hedges = 0
+
+    async def chat(self, messages: List[Dict[str, str]]) -> str:
+        """Sends a chat request, hedging across providers."""
+        return await self._hedged(lambda client: client.chat(messages))
+
+    async def chat_structured(
+        self, messages: List[Dict[str, str]], schema: Type[BaseModel]
+    ) -> str:
+        """Sends a structured-output chat request, hedging across providers."""
+        return await self._hedged(
+            lambda client: client.chat_structured(messages, schema)
+        )
+
+    async def chat_stream(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """
+        Streams from the fastest provider. Streams are not hedged, but a provider
+        that fails or times out before its first piece fails over to the next.
+        """
+        errors: List[str] = []
+        for client in self._ranked():
+            stream = client.chat_stream(messages)
+            start = time.monotonic()
+            try:
+                first = await asyncio.wait_for(stream.__anext__(), self.timeout)
+            except StopAsyncIteration:
+                return
+            except Exception as e:
+                self._window(client).record(self.timeout)
+                errors.append(f"{client.provider}: {e!r}")
+                await stream.aclose()
+                continue
+            self._window(client).record(time.monotonic() - start)
+            _record_answer(client)
+            try:
+                yield first
+                async for piece in stream:
+                    yield piece
+            finally:
+                await stream.aclose()
+            return
+        raise RuntimeError(f"All LLM providers failed: {'; '.join(errors)}")
+
+    async def _hedged(self, call: Callable[[LLMClient], Awaitable[str]]) -> str:
+        """Runs `call` against the ranked providers, hedging and failing over."""
+        waiting = self._ranked()
+        running: Dict[asyncio.Task, LLMClient] = {}
+        started: Dict[asyncio.Task, float] = {}
+        errors: List[str] = []
+
+        def launch() -> None:
+            client = waiting.pop(0)
+            task = asyncio.create_task(self._timed(client, call))
+            running[task] = client
+            started[task] = time.monotonic()
+
+        launch()
+        try:
+            while running:
+                hedge_delay = None
+                if waiting and len(running) == 1:
+                    hedge_delay = self._hedge_delay(next(iter(running.values())))
+                done, _ = await asyncio.wait(
+                    running, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # The request is slower than usual; race it against the next one
+                    self.hedges += 1
+                    logger.info(f"Hedging slow LLM request to {waiting[0].provider}.")
+                    launch()
+                    continue
+                for task in done:
+                    client = running.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        errors.append(f"{client.provider}: {e!r}")
+                        logger.warning(
+                            f"LLM provider {client.provider} failed: {e!r}"
+                        )
+                        continue
+                    # A loser that started first is at least this slow; remember
+                    # that so routing stops preferring it.
+                    now = time.monotonic()
+                    for loser, loser_client in running.items():
+                        if started[loser] < started[task]:
+                            self._window(loser_client).record(now - started[loser])
+                    _record_answer(client)
+                    return result
+                if waiting and not running:
+                    launch()
+        finally:
+            # Cancel the losing (or abandoned) requests
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+        raise RuntimeError(f"All LLM providers failed: {'; '.join(errors)}")
+
+    async def _timed(
+        self, client: LLMClient, call: Callable[[LLMClient], Awaitable[str]]
+    ) -> str:
+        """Runs one provider call under the timeout, recording its latency."""
+        start = time.monotonic()
+        try:
+            result = await asyncio.wait_for(call(client), self.timeout)
+        except Exception:
+            self._window(client).record(self.timeout)
+            raise
+        self._window(client).record(time.monotonic() - start)
+        return result
+
+    def _ranked(self) -> List[LLMClient]:
+        """Clients ordered by recent median latency; unmeasured ones first."""
+        order = {id(client): index for index, client in enumerate(self.clients)}
+        return sorted(
+            self.clients,
+            key=lambda client: (self._window(client).median(), order[id(client)]),
+        )
+
+    def _hedge_delay(self, client: LLMClient) -> float:
+        window = self._window(client)
+        if len(window.samples) < self.min_samples:
+            return self.initial_hedge_delay
+        return window.percentile(self.hedge_percentile)
+
+    def _window(self, client: LLMClient) -> _LatencyWindow:
+        return self.latencies[id(client)]
@@ -0,0 +1,127 @@
+import json
+import re
+from typing import Any, List
+
+# Python literals that models sometimes emit in place of JSON ones.
+_LITERALS = {"True": "true", "False": "false", "None": "null"}
+# Typographic quotes used as string delimiters, mapped to their closing quote.
+_SMART_QUOTES = {"“": "”", "‘": "’"}
+_FENCE = re.compile(r"```(?:json)?\s*\n?(.*?)(?:```|$)", re.DOTALL)
+
+
+def loads_tolerant(text: str) -> Any:
+    """
+    Parses the JSON value in an LLM response, repairing common mistakes.
+
+    Handles markdown fences, prose around the value, trailing commas, comments,
+    single or typographic quotes, unquoted keys, Python literals, raw newlines in
+    strings and output truncated mid-value.
+
+    Raises:
+        json.JSONDecodeError: If no JSON value can be recovered.
+    """
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    # Only look for a fence once the raw text has failed to parse; a valid value
+    # may itself contain one, e.g. a code block in a markdown string.
+    fenced = _FENCE.search(text)
+    if fenced and fenced.group(1).strip():
+        text = fenced.group(1)
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+
+    start = min(
+        (index for index in (text.find("{"), text.find("[")) if index != -1),
+        default=-1,
+    )
+    if start == -1:
+        raise json.JSONDecodeError("No JSON object or array found", text, 0)
+    return json.loads(_repair(text[start:]))
+
+
+def _repair(text: str) -> str:
+    """Rewrites the first JSON-like value in `text` into strict JSON."""
+    out: List[str] = []
+    closers: List[str] = []
+    quote = None  # Closing delimiter of the string being read, if any
+    i = 0
+    while i < len(text):
+        char = text[i]
+
+        if quote is not None:
+            if char == "\\" and i + 1 < len(text):
+                escaped = text[i + 1]
+                # \' is not a valid JSON escape
+                out.append("'" if escaped == "'" else char + escaped)
+                i += 2
+                continue
+            if char == quote:
+                out.append('"')
+                quote = None
+            elif char == '"':
+                out.append('\\"')
+            elif char == "\n":
+                out.append("\\n")
+            elif char == "\t":
+                out.append("\\t")
+            else:
+                out.append(char)
+            i += 1
+            continue
+
+        if char in "\"'" or char in _SMART_QUOTES:
+            quote = _SMART_QUOTES.get(char, char)
+            out.append('"')
+        elif char in "{[":
+            closers.append("}" if char == "{" else "]")
+            out.append(char)
+        elif char in "}]":
+            _drop_trailing_comma(out)
+            if closers:
+                closers.pop()
+            out.append(char)
+            if not closers:
+                break  # The top-level value is complete; ignore what follows
+        elif text.startswith("//", i):
+            newline = text.find("\n", i)
+            i = len(text) if newline == -1 else newline
+            continue
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            i = len(text) if end == -1 else end + 2
+            continue
+        elif char.isalpha() or char == "_":
+            match = re.match(r"[A-Za-z_][A-Za-z0-9_]*", text[i:])
+            word = match.group(0)
+            if re.match(r"\s*:", text[i + len(word):]):
+                out.append(f'"{word}"')  # Unquoted key
+            else:
+                out.append(_LITERALS.get(word, word))
+            i += len(word)
+            continue
+        else:
+            out.append(char)
+        i += 1
+
+    # Close anything left open by a truncated response
+    if quote is not None:
+        out.append('"')
+    if closers:
+        _drop_trailing_comma(out)
+        if "".join(out).rstrip().endswith(":"):
+            out.append("null")
+        out.extend(reversed(closers))
+    return "".join(out)
+
+
+def _drop_trailing_comma(out: List[str]) -> None:
+    """Removes a comma (and whitespace after it) from the end of `out`."""
+    index = len(out) - 1
+    while index >= 0 and out[index].isspace():
+        index -= 1
+    if index >= 0 and out[index] == ",":
+        del out[index:]
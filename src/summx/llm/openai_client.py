@@ -1,6 +1,7 @@
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List, Type
 
 from openai import AsyncOpenAI
+from pydantic import BaseModel
 
 from .base import LLMClient
 
@@ -8,6 +9,8 @@ from .base import LLMClient
 class OpenAIClient(LLMClient):
     """LLM client for OpenAI API."""
 
+    provider = "openai"
+
     def __init__(self, api_key: str, model: str):
         self.api_key = api_key
         self.model = model
@@ -27,3 +30,49 @@ class OpenAIClient(LLMClient):
         except Exception as e:
             # In a real app, you'd want more specific error handling
             raise RuntimeError(f"Error calling OpenAI API: {e}") from e
+
+    async def chat_structured(
+        self, messages: List[Dict[str, str]], schema: Type[BaseModel]
+    ) -> str:
+        """
+        Sends a chat request using the OpenAI API's schema-constrained output mode.
+        """
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,  # type: ignore
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": schema.__name__,
+                        "schema": schema.model_json_schema(),
+                    },
+                },  # type: ignore
+            )
+            content = response.choices[0].message.content
+            if content is None:
+                raise ValueError("Received null content from OpenAI API.")
+            return content
+        except Exception as e:
+            raise RuntimeError(f"Error calling OpenAI API: {e}") from e
+
+    async def chat_stream(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Streams a chat response from the OpenAI API as it is generated."""
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,  # type: ignore
+                stream=True,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Error calling OpenAI API: {e}") from e
+
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise RuntimeError(f"Error streaming from OpenAI API: {e}") from e
+        finally:
+            # Stops the generation server-side if the caller stopped reading early
+            await stream.close()
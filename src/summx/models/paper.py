@@ -59,4 +59,7 @@ class PaperResult(BaseModel):
     meta: PaperMeta
     content: Optional[PaperContentSections] = None
     summary: Optional[PaperSummary] = None
-    plan_tags: List[str] = Field(default_factory=list)
\ No newline at end of file
+    plan_tags: List[str] = Field(default_factory=list)
+    # Position of the paper in the search results (0-based), so results that
+    # arrive out of order from a stream can be placed correctly.
+    rank: Optional[int] = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 SortType = Literal["most_recent", "relevance"]
 DepthType = Literal["abstract", "abstract+intro+conclusion", "full"]
@@ -19,10 +19,12 @@ class SearchFilters(BaseModel):
 
 class SearchPlan(BaseModel):
     """The main plan object used internally by the agent."""
-    intent: str = "search_papers"
+    intent: str = "search_papers"  # or "summarize_ids" for explicit arxiv_ids
     source: str = "arxiv"
     filters: SearchFilters = Field(default_factory=SearchFilters)
     sort: SortType = "most_recent"
     limit: int = 5
     summarization: SummarizationConfig = Field(default_factory=SummarizationConfig)
+    # Papers requested by ID; only used by the "summarize_ids" intent
+    arxiv_ids: List[str] = Field(default_factory=list)
     raw_query: str
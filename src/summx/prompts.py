@@ -74,3 +74,45 @@ Your JSON Output:
     }}
 }}
 """
+
+
+SUMMARIZER_SYSTEM_PROMPT = (
+    "You are a research assistant. Your task is to summarize a paper's abstract."
+    "Analyze the text and provide a summary in the following JSON format:\n"
+    "{\n"
+    '    "tldr": ["A one-sentence summary."],\n'
+    '    "problem": "What problem is the paper trying to solve?",\n'
+    '    "method": "What method does the paper propose?",\n'
+    '    "results": "What are the key results?",\n'
+    '    "limitations": "What are the limitations of the work?",\n'
+    '    "future_work": "What are the suggestions for future work?",\n'
+    '    "raw_markdown": "A markdown-formatted summary."\n'
+    "}\n"
+)
+
+SUMMARIZER_CHUNK_PROMPT = (
+    "You are a research assistant reading one part of a longer research paper. "
+    "Write concise plain-text notes on what this part says about the problem, the "
+    "method, the results, the limitations and future work. Skip anything that is "
+    "not covered in this part. Do not output JSON."
+)
+
+SUMMARIZER_BATCH_PROMPT = (
+    "You are a research assistant. You will be given several papers, each introduced "
+    "by a line of the form '### Paper <id>'. Summarize every paper independently and "
+    "respond with a single JSON array containing one object per paper, in this "
+    "format:\n"
+    "[\n"
+    "    {\n"
+    '        "id": "The <id> of the paper, exactly as given.",\n'
+    '        "tldr": ["A one-sentence summary."],\n'
+    '        "problem": "What problem is the paper trying to solve?",\n'
+    '        "method": "What method does the paper propose?",\n'
+    '        "results": "What are the key results?",\n'
+    '        "limitations": "What are the limitations of the work?",\n'
+    '        "future_work": "What are the suggestions for future work?",\n'
+    '        "raw_markdown": "A markdown-formatted summary."\n'
+    "    }\n"
+    "]\n"
+    "Do not output any text before or after the JSON array."
+)
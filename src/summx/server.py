@@ -0,0 +1,193 @@
+"""
+A small local HTTP API that keeps a PaperAgent warm between queries.
+
+The daemon (`summx serve`) builds the agent once, so LLM clients, pooled arXiv
+connections, extraction workers and caches are reused by every query. It listens
+on a TCP port or a Unix socket and handles each connection in its own task.
+
+Endpoints:
+    GET  /health   -> {"status": "ok"}
+    POST /query    {"query": "..."} -> newline-delimited JSON events, streamed as
+                   they happen: {"plan": ...}, then one {"result": ...} per paper
+                   (in completion order), then {"done": true, "count": N}, or
+                   {"error": "..."} if the query fails.
+"""
+
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from summx.agent import PaperAgent
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 1024 * 1024
+HEADER_TIMEOUT = 10.0
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large"}
+
+
+class BadRequest(Exception):
+    """Raised for requests the server cannot parse."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+class SummXServer:
+    """Serves queries against a long-lived PaperAgent over HTTP/1.1."""
+
+    def __init__(self, agent: PaperAgent, max_concurrent_queries: int = 8):
+        """
+        Initializes the SummXServer.
+
+        Args:
+            agent: The agent shared by all requests; the caller owns and closes it.
+            max_concurrent_queries: Queries executed at once; others wait their turn.
+        """
+        self.agent = agent
+        self._query_slots = asyncio.Semaphore(max_concurrent_queries)
+
+    async def serve(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        unix_socket: Optional[Path] = None,
+    ) -> None:
+        """Listens on a Unix socket if given, else on host:port, until cancelled."""
+        if unix_socket is not None:
+            unix_socket.unlink(missing_ok=True)
+            server = await asyncio.start_unix_server(self.handle, path=str(unix_socket))
+            logger.info(f"SummX server listening on unix:{unix_socket}")
+        else:
+            server = await asyncio.start_server(self.handle, host, port)
+            logger.info(f"SummX server listening on http://{host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if unix_socket is not None:
+                unix_socket.unlink(missing_ok=True)
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Handles a single connection (one request per connection)."""
+        try:
+            try:
+                method, path, body = await asyncio.wait_for(
+                    _read_request(reader), HEADER_TIMEOUT
+                )
+            except BadRequest as e:
+                await _send_json(writer, e.status, {"error": str(e)})
+                return
+            except (
+                asyncio.TimeoutError,
+                asyncio.IncompleteReadError,
+                asyncio.LimitOverrunError,
+                ValueError,  # A line longer than the reader's limit
+            ):
+                await _send_json(writer, 400, {"error": "Bad request"})
+                return
+
+            if method == "GET" and path == "/health":
+                await _send_json(writer, 200, {"status": "ok"})
+            elif method == "POST" and path == "/query":
+                await self._query(writer, body)
+            else:
+                error = f"No route for {method} {path}"
+                await _send_json(writer, 404, {"error": error})
+        except ConnectionError:
+            logger.info("Client disconnected before the response was complete.")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _query(self, writer: asyncio.StreamWriter, body: bytes) -> None:
+        """Runs a query, streaming the plan and each result as NDJSON events."""
+        try:
+            query = json.loads(body or b"{}").get("query")
+        except (json.JSONDecodeError, AttributeError):
+            query = None
+        if not isinstance(query, str) or not query.strip():
+            error = 'Expected a JSON body {"query": "..."}'
+            await _send_json(writer, 400, {"error": error})
+            return
+
+        writer.write(
+            _status_line(200)
+            + b"Content-Type: application/x-ndjson\r\nConnection: close\r\n\r\n"
+        )
+
+        def send(event: Dict) -> None:
+            writer.write(json.dumps(event).encode() + b"\n")
+
+        count = 0
+        async with self._query_slots:
+            try:
+                async for result in self.agent.run_stream(
+                    query,
+                    on_plan=lambda plan: send({"plan": plan.model_dump(mode="json")}),
+                ):
+                    send({"result": result.model_dump(mode="json")})
+                    count += 1
+                    # Backpressure: don't outrun a slow client
+                    await writer.drain()
+            except ConnectionError:
+                raise
+            except Exception as e:
+                logger.exception(f"Query '{query}' failed")
+                send({"error": str(e)})
+            else:
+                send({"done": True, "count": count})
+        await writer.drain()
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+    """Reads the request line, headers and body of an HTTP/1.1 request."""
+    request_line = (await reader.readline()).decode("latin-1").strip()
+    parts = request_line.split()
+    if len(parts) != 3:
+        raise BadRequest("Malformed request line")
+    method, path, _ = parts
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+        if len(headers) > 100:
+            raise BadRequest("Too many headers")
+
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise BadRequest("Invalid Content-Length") from None
+    if length < 0:
+        raise BadRequest("Invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise BadRequest("Request body too large", status=413)
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), path.split("?", 1)[0], body
+
+
+async def _send_json(writer: asyncio.StreamWriter, status: int, payload: Dict) -> None:
+    body = json.dumps(payload).encode()
+    writer.write(
+        _status_line(status)
+        + b"Content-Type: application/json\r\n"
+        + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+
+
+def _status_line(status: int) -> bytes:
+    return f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n".encode()
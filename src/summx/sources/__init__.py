@@ -6,12 +6,63 @@ The primary interface is the `PaperSourceClient` abstract base class.
 
 from .base import PaperSourceClient
 from .arxiv_api_client import ArxivApiClient
+from .extraction import PdfExtractor
+from .ratelimit import RetryPolicy, shared_bucket
+from summx.cache import ContentStore, PdfStore, SearchCache
 from summx.config import SummXConfig
 
 def get_source_client(config: SummXConfig) -> PaperSourceClient:
-    """Factory function to get a paper source client based on the config."""
+    """
+    Factory function to get a paper source client based on the config.
+
+    The returned client owns pooled connections; close it with `aclose()` or use
+    it as an async context manager.
+    """
     if config.paper_source == "api":
-        return ArxivApiClient()
+        pdf_store = None
+        if config.pdf_cache_enabled:
+            pdf_store = PdfStore(
+                config.cache_dir / "pdfs",
+                max_bytes=config.pdf_cache_max_mb * 1024 * 1024,
+            )
+        content_store = None
+        if config.content_cache_enabled:
+            content_store = ContentStore(config.cache_dir / "content.sqlite3")
+        search_cache = None
+        if config.search_cache_enabled:
+            search_cache = SearchCache(
+                most_recent_ttl=config.search_cache_most_recent_ttl,
+                relevance_ttl=config.search_cache_relevance_ttl,
+                max_stale=config.search_cache_max_stale,
+            )
+        return ArxivApiClient(
+            search_backend=config.arxiv_search_backend,
+            timeout=config.http_timeout,
+            max_connections=config.http_max_connections,
+            max_keepalive_connections=config.http_max_keepalive_connections,
+            keepalive_expiry=config.http_keepalive_expiry,
+            http2=config.http2,
+            pdf_store=pdf_store,
+            content_store=content_store,
+            search_cache=search_cache,
+            extractor=PdfExtractor(
+                max_workers=config.extraction_workers,
+                max_tasks_per_child=config.extraction_max_tasks_per_child,
+            ),
+            # Shared across clients, so concurrent agents stay within arXiv's limits
+            api_limiter=shared_bucket(
+                "arxiv-api", config.arxiv_api_rate, config.arxiv_api_burst
+            ),
+            pdf_limiter=shared_bucket(
+                "arxiv-pdf", config.pdf_download_rate, config.pdf_download_burst
+            ),
+            retry=RetryPolicy(
+                max_retries=config.http_max_retries,
+                base_delay=config.http_backoff_base,
+                max_delay=config.http_backoff_max,
+                max_retry_after=config.http_max_retry_after,
+            ),
+        )
     # In the future, this is where we would add the MCP client.
     # elif config.paper_source == "mcp":
     #     from .arxiv_mcp_client import ArxivMcpClient
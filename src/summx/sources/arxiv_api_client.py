@@ -1,27 +1,254 @@
+import asyncio
+import importlib.util
+import logging
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+from contextlib import asynccontextmanager
+from itertools import count
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Dict, Hashable, List, Literal, Optional
+
 import arxiv
-import fitz  # PyMuPDF
 import httpx
-from typing import List
 
-from summx.models.paper import PaperMeta, PaperContentSections
-from summx.models.plan import SearchPlan, SortType
+from summx.cache import ContentStore, PdfStore, SearchCache
+from summx.models.paper import PaperContentSections, PaperMeta
+from summx.models.plan import DepthType, SearchPlan, SortType
+from summx.sources.arxiv_atom import ArxivApiError, AtomFeedParser
 from summx.sources.base import PaperSourceClient
+from summx.sources.extraction import EXTRACTOR_VERSION, PdfExtractor
+from summx.sources.ratelimit import RetryPolicy, TokenBucket, parse_retry_after
+from summx.utils import split_arxiv_id
+
+logger = logging.getLogger(__name__)
+
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+
+# PDFs are streamed to disk in chunks of this many bytes.
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# arXiv asks API clients to send no more than one request every three seconds.
+ARXIV_API_RATE = 1 / 3
+
+SearchBackend = Literal["httpx", "arxiv"]
 
 
 class ArxivApiClient(PaperSourceClient):
     """A client for interacting directly with the arXiv API."""
 
+    def __init__(
+        self,
+        search_backend: SearchBackend = "httpx",
+        api_url: str = ARXIV_API_URL,
+        timeout: float = 30.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        pdf_store: Optional[PdfStore] = None,
+        content_store: Optional[ContentStore] = None,
+        search_cache: Optional[SearchCache] = None,
+        extractor: Optional[PdfExtractor] = None,
+        api_limiter: Optional[TokenBucket] = None,
+        pdf_limiter: Optional[TokenBucket] = None,
+        retry: Optional[RetryPolicy] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initializes the ArxivApiClient.
+
+        The client owns a single pooled `httpx.AsyncClient` that is created on first
+        use and shared by every search and download until `aclose()` is called, so
+        connections to arXiv are reused across papers.
+
+        Args:
+            search_backend: "httpx" queries the Atom API asynchronously and only
+                falls back to the `arxiv` package if that fails; "arxiv" always
+                uses the `arxiv` package (run in a worker thread).
+            api_url: The arXiv API query endpoint.
+            timeout: Timeout in seconds for HTTP requests.
+            max_connections: Maximum number of concurrent pooled connections.
+            max_keepalive_connections: Maximum number of idle connections kept alive.
+            keepalive_expiry: Seconds an idle connection is kept before closing.
+            http2: Enable HTTP/2 (requires the optional `h2` package).
+            pdf_store: Optional on-disk PDF cache consulted before downloading.
+            content_store: Optional cache of extracted content, consulted before
+                the PDF is downloaded or parsed.
+            search_cache: Optional TTL cache of search results.
+            extractor: Engine used to extract PDF text off the event loop;
+                defaults to extracting in a worker thread.
+            api_limiter: Rate limiter for Atom API requests; defaults to arXiv's
+                guidance of one request every three seconds.
+            pdf_limiter: Rate limiter for PDF downloads; defaults to one per second
+                with bursts of four.
+            retry: How throttled (429/503) and failed requests are retried.
+            transport: Optional httpx transport, mainly useful for testing.
+        """
+        self.search_backend = search_backend
+        self.api_url = api_url
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning(
+                "HTTP/2 requested but the 'h2' package is not installed; "
+                "using HTTP/1.1."
+            )
+            http2 = False
+        self.http2 = http2
+        self.pdf_store = pdf_store
+        self.content_store = content_store
+        self.search_cache = search_cache
+        self.extractor = extractor or PdfExtractor(max_workers=0)
+        self.api_limiter = api_limiter or TokenBucket(rate=ARXIV_API_RATE)
+        self.pdf_limiter = pdf_limiter or TokenBucket(rate=1.0, burst=4)
+        self.retry = retry or RetryPolicy()
+        self._refresh_tasks: Dict[Hashable, asyncio.Task] = {}
+        # PDFs downloaded by `prefetch_paper` that have not been extracted yet.
+        self._prefetched: Dict[str, Path] = {}
+        self.transport = transport
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """The shared, pooled HTTP client, created on first use."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self.transport,
+                follow_redirects=True,
+            )
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """
+        Cancel background refreshes, close the pooled HTTP client and stop any
+        extraction workers.
+        """
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        await asyncio.gather(*self._refresh_tasks.values(), return_exceptions=True)
+        self._refresh_tasks.clear()
+
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+        await asyncio.to_thread(self.extractor.shutdown)
+
+        if self.pdf_store is None:
+            for path in self._prefetched.values():
+                path.unlink(missing_ok=True)
+        self._prefetched.clear()
+
     async def search_papers(self, plan: SearchPlan) -> List[PaperMeta]:
-        """Search for papers using the official arXiv API."""
+        """
+        Search for papers using the arXiv API.
+
+        With a search cache configured, fresh results are served from it directly,
+        and stale ones are served while a background task refreshes them.
+        """
+        if self.search_cache is None:
+            return await self._search(plan)
+
+        key = self.search_key(plan)
+        cached = self.search_cache.get(key)
+        if cached is not None:
+            results, is_stale = cached
+            if is_stale:
+                self._schedule_refresh(key, plan)
+            return results
+
+        results = await self._search(plan)
+        self.search_cache.put(key, plan.sort, results)
+        return results
+
+    def search_key(self, plan: SearchPlan) -> Hashable:
+        """Searches are identified by the built query string, sort and limit."""
+        return (self._build_query(plan), plan.sort, plan.limit)
+
+    def _schedule_refresh(self, key: Hashable, plan: SearchPlan) -> None:
+        """Refresh a stale search result in the background, once per key."""
+        if key in self._refresh_tasks:
+            return
+        task = asyncio.create_task(self._refresh(key, plan))
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+
+    async def _refresh(self, key: Hashable, plan: SearchPlan) -> None:
+        try:
+            self.search_cache.put(key, plan.sort, await self._search(plan))
+        except Exception as e:
+            logger.warning(f"Background refresh of search {key} failed: {e}")
+
+    async def _search(self, plan: SearchPlan) -> List[PaperMeta]:
+        """Run a search against arXiv, bypassing the search cache."""
         query = self._build_query(plan)
-        sort_by = self._get_sort_by(plan.sort)
 
+        if self.search_backend == "httpx":
+            params = {
+                "search_query": query,
+                "start": "0",
+                "max_results": str(plan.limit),
+                "sortBy": self._get_sort_param(plan.sort),
+                "sortOrder": "descending",
+            }
+            try:
+                return await self._query_atom(params)
+            except (httpx.HTTPError, ET.ParseError, ArxivApiError) as e:
+                logger.warning(
+                    f"Async arXiv search failed ({e}); "
+                    "falling back to the arxiv package."
+                )
+
+        # The arxiv package is synchronous (blocking HTTP and sleeps), so keep it
+        # off the event loop.
         search = arxiv.Search(
             query=query,
             max_results=plan.limit,
-            sort_by=sort_by,
+            sort_by=self._get_sort_by(plan.sort),
         )
+        return await asyncio.to_thread(self._run_arxiv_package_search, search)
+
+    async def fetch_papers(self, arxiv_ids: List[str]) -> List[PaperMeta]:
+        """Fetch metadata for several papers with a single `id_list` query."""
+        if not arxiv_ids:
+            return []
+
+        if self.search_backend == "httpx":
+            params = {
+                "id_list": ",".join(arxiv_ids),
+                "max_results": str(len(arxiv_ids)),
+            }
+            try:
+                return await self._query_atom(params)
+            except (httpx.HTTPError, ET.ParseError, ArxivApiError) as e:
+                logger.warning(
+                    f"Async arXiv lookup failed ({e}); "
+                    "falling back to the arxiv package."
+                )
 
+        search = arxiv.Search(id_list=list(arxiv_ids), max_results=len(arxiv_ids))
+        return await asyncio.to_thread(self._run_arxiv_package_search, search)
+
+    async def _query_atom(self, params: Dict[str, str]) -> List[PaperMeta]:
+        """Query the Atom API with httpx, parsing entries as the body streams in."""
+        parser = AtomFeedParser()
+        results: List[PaperMeta] = []
+        async with self._stream(self.api_url, self.api_limiter, params) as response:
+            async for chunk in response.aiter_bytes():
+                results.extend(parser.feed(chunk))
+        results.extend(parser.close())
+        return results
+
+    def _run_arxiv_package_search(self, search: arxiv.Search) -> List[PaperMeta]:
+        """Blocking search through the `arxiv` package, used as a fallback."""
         results = []
         for result in search.results():
             meta = PaperMeta(
@@ -37,28 +264,217 @@ class ArxivApiClient(PaperSourceClient):
         return results
 
     async def read_paper(self, arxiv_id: str) -> PaperContentSections:
-        """Download the PDF for a paper and extract its text content."""
-        # First, get the paper's metadata to find its PDF URL
-        search = arxiv.Search(id_list=[arxiv_id])
-        paper = next(search.results(), None)
-        if not paper or not paper.pdf_url:
-            raise ValueError(f"Could not find paper or PDF URL for arXiv ID: {arxiv_id}")
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(paper.pdf_url)
-            response.raise_for_status()  # Ensure the download was successful
-
-        pdf_bytes = response.content
-        text_content = ""
-        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
-            for page in doc:
-                text_content += page.get_text()
-
-        return PaperContentSections(
-            full_text=text_content,
-            abstract=paper.summary
+        """Look up a paper by ID, then download its PDF and extract the text."""
+        metas = await self.fetch_papers([arxiv_id])
+        if not metas:
+            raise ValueError(f"Could not find paper for arXiv ID: {arxiv_id}")
+        return await self.read_paper_from_meta(metas[0])
+
+    async def read_paper_from_meta(
+        self, meta: PaperMeta, depth: DepthType = "full"
+    ) -> PaperContentSections:
+        """
+        Extract the text content of a paper whose metadata is already known.
+
+        Previously extracted content is served from the content store; otherwise the
+        PDF is read from the PDF store or downloaded from `meta.pdf_url`. Only the
+        pages needed for `depth` are parsed.
+        """
+        (content,) = await self.read_papers([meta], depth=depth)
+        return content
+
+    async def read_papers(
+        self, metas: List[PaperMeta], depth: DepthType = "full"
+    ) -> List[PaperContentSections]:
+        """
+        Read several papers, resolving any missing PDF URLs with one batched lookup.
+        """
+        stored = [await self._get_stored_content(meta, depth) for meta in metas]
+        pending = [
+            meta for meta, content in zip(metas, stored, strict=True) if content is None
+        ]
+
+        await self._with_pdf_urls(pending)
+        extracted = iter(
+            await asyncio.gather(
+                *(self._download_and_extract(meta, depth) for meta in pending)
+            )
+        )
+        return [
+            content if content is not None else next(extracted) for content in stored
+        ]
+
+    async def _get_stored_content(
+        self, meta: PaperMeta, depth: DepthType
+    ) -> Optional[PaperContentSections]:
+        """Look the paper up in the content store, if one is configured."""
+        if self.content_store is None:
+            return None
+        return await asyncio.to_thread(
+            self.content_store.get, meta.arxiv_id, EXTRACTOR_VERSION, depth
         )
 
+    async def prefetch_paper(self, meta: PaperMeta, depth: DepthType = "full") -> None:
+        """
+        Download a paper's PDF ahead of extraction, unless its extracted content or
+        its PDF is already stored. A later `read_paper_from_meta` picks it up.
+        """
+        if meta.arxiv_id in self._prefetched:
+            return
+        if self.content_store is not None and await asyncio.to_thread(
+            self.content_store.contains, meta.arxiv_id, EXTRACTOR_VERSION, depth
+        ):
+            return
+        if self.pdf_store is not None and await asyncio.to_thread(
+            self.pdf_store.contains, meta.arxiv_id
+        ):
+            return
+
+        await self._with_pdf_urls([meta])
+        self._prefetched[meta.arxiv_id] = await self._download_pdf(meta)
+
+    async def _download_and_extract(
+        self, meta: PaperMeta, depth: DepthType
+    ) -> PaperContentSections:
+        """
+        Extract a paper's text, downloading its PDF only if it was not prefetched and
+        is not already in the PDF store. Fills in `meta.local_pdf_path` when the PDF
+        is stored on disk.
+        """
+        pdf_path = self._prefetched.pop(meta.arxiv_id, None)
+        if pdf_path is None and self.pdf_store is not None:
+            pdf_path = await asyncio.to_thread(self.pdf_store.get, meta.arxiv_id)
+        if pdf_path is None:
+            pdf_path = await self._download_pdf(meta)
+
+        # Without a PDF store, downloads are temporary files removed after extraction.
+        is_temporary = self.pdf_store is None
+        if not is_temporary:
+            meta.local_pdf_path = str(pdf_path)
+        try:
+            content = await self.extractor.extract(str(pdf_path), depth)
+        finally:
+            if is_temporary:
+                pdf_path.unlink(missing_ok=True)
+
+        # The abstract from the metadata is authoritative; segmentation is a fallback.
+        content.abstract = meta.abstract or content.abstract
+        if self.content_store is not None:
+            await asyncio.to_thread(
+                self.content_store.put, meta.arxiv_id, EXTRACTOR_VERSION, content, depth
+            )
+        return content
+
+    async def _download_pdf(self, meta: PaperMeta) -> Path:
+        """Stream a paper's PDF into the PDF store, or to a temporary file."""
+        if self.pdf_store is not None:
+            with self.pdf_store.writer(meta.arxiv_id) as f:
+                await self._stream_download(meta.pdf_url, f)
+            path = self.pdf_store.path_for(meta.arxiv_id)
+            # Eviction scans the whole store; keep it off the event loop
+            await asyncio.to_thread(self.pdf_store.evict, path)
+            return path
+
+        fd, name = tempfile.mkstemp(prefix="summx-", suffix=".pdf")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                await self._stream_download(meta.pdf_url, f)
+        except BaseException:
+            Path(name).unlink(missing_ok=True)
+            raise
+        return Path(name)
+
+    async def _stream_download(self, url: str, f: BinaryIO) -> None:
+        """Stream a response body into `f` in chunks, never buffering it whole."""
+        async with self._stream(url, self.pdf_limiter) as response:
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+
+    @asynccontextmanager
+    async def _stream(
+        self,
+        url: str,
+        limiter: TokenBucket,
+        params: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Open a rate-limited streaming GET request, raising for unsuccessful statuses.
+
+        Throttling responses and transport errors are retried with jittered
+        exponential backoff. A Retry-After header is honored and also pauses the
+        limiter, so every request to that host backs off, not just this one.
+        """
+        request = self.http_client.build_request("GET", url, params=params)
+        for attempt in count():
+            await limiter.acquire()
+            try:
+                response = await self.http_client.send(request, stream=True)
+            except httpx.TransportError as e:
+                if attempt >= self.retry.max_retries:
+                    raise
+                delay = self.retry.backoff(attempt)
+                logger.warning(
+                    f"Request to {url} failed ({e}); retrying in {delay:.1f}s."
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if (
+                response.status_code in self.retry.retry_statuses
+                and attempt < self.retry.max_retries
+                and (retry_after is None or retry_after <= self.retry.max_retry_after)
+            ):
+                await response.aclose()
+                if retry_after is not None:
+                    limiter.pause(retry_after)
+                    delay = retry_after
+                else:
+                    delay = self.retry.backoff(attempt)
+                logger.warning(
+                    f"{url} responded {response.status_code}; retrying in {delay:.1f}s."
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            try:
+                response.raise_for_status()
+                yield response
+            finally:
+                await response.aclose()
+            return
+
+    async def _with_pdf_urls(self, metas: List[PaperMeta]) -> List[PaperMeta]:
+        """Fill in missing `pdf_url`s using a single `id_list` query."""
+        missing = []
+        for meta in metas:
+            if meta.pdf_url:
+                continue
+            if self.pdf_store is not None and await asyncio.to_thread(
+                self.pdf_store.contains, meta.arxiv_id
+            ):
+                continue
+            missing.append(meta.arxiv_id)
+        if not missing:
+            return metas
+
+        fetched: Dict[str, PaperMeta] = {}
+        for found in await self.fetch_papers(missing):
+            fetched[found.arxiv_id] = found
+            fetched.setdefault(split_arxiv_id(found.arxiv_id)[0], found)
+
+        for meta in metas:
+            if meta.arxiv_id not in missing:
+                continue
+            found = fetched.get(meta.arxiv_id)
+            if not found or not found.pdf_url:
+                raise ValueError(
+                    f"Could not find paper or PDF URL for arXiv ID: {meta.arxiv_id}"
+                )
+            meta.pdf_url = found.pdf_url
+            meta.abstract = meta.abstract or found.abstract
+        return metas
+
     def _build_query(self, plan: SearchPlan) -> str:
         """Build the query string for the arXiv API from a SearchPlan."""
         parts = []
@@ -68,6 +484,12 @@ class ArxivApiClient(PaperSourceClient):
             parts.append(f'au:"{plan.filters.author}"')
         return " AND ".join(parts)
 
+    def _get_sort_param(self, sort: SortType) -> str:
+        """Map our internal SortType to the Atom API's `sortBy` parameter."""
+        if sort == "relevance":
+            return "relevance"
+        return "submittedDate"
+
     def _get_sort_by(self, sort: SortType) -> arxiv.SortCriterion:
         """Map our internal SortType to the arxiv package's SortCriterion."""
         if sort == "relevance":
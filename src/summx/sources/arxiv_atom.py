@@ -0,0 +1,95 @@
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import List, Optional
+
+from summx.models.paper import PaperMeta
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+ARXIV_NS = "{http://arxiv.org/schemas/atom}"
+
+
+class ArxivApiError(RuntimeError):
+    """Raised when the arXiv API reports an error inside its Atom feed."""
+
+
+class AtomFeedParser:
+    """
+    Incremental parser for arXiv Atom feeds.
+
+    Bytes can be fed in as they arrive from the network; every call to `feed`
+    returns the entries that were completed by that chunk, so callers never
+    need to buffer the whole response.
+    """
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=("end",))
+
+    def feed(self, chunk: bytes) -> List[PaperMeta]:
+        """Feed a chunk of the response body and return any completed entries."""
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> List[PaperMeta]:
+        """Signal the end of the feed and return any remaining entries."""
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> List[PaperMeta]:
+        papers = []
+        for _, element in self._parser.read_events():
+            if element.tag != f"{ATOM_NS}entry":
+                continue
+            papers.append(parse_entry(element))
+            # Entries are self-contained, so free them as soon as they are mapped.
+            element.clear()
+        return papers
+
+
+def parse_entry(entry: ET.Element) -> PaperMeta:
+    """Map a single Atom `<entry>` element to a PaperMeta."""
+    entry_id = _text(entry, "id")
+    if "/api/errors" in entry_id:
+        raise ArxivApiError(f"arXiv API error: {_text(entry, 'summary')}")
+
+    pdf_url: Optional[str] = None
+    for link in entry.findall(f"{ATOM_NS}link"):
+        if link.get("title") == "pdf":
+            pdf_url = link.get("href")
+            break
+
+    return PaperMeta(
+        arxiv_id=entry_id.split("/abs/")[-1],
+        title=_collapse_whitespace(_text(entry, "title")),
+        authors=[
+            _text(author, "name") for author in entry.findall(f"{ATOM_NS}author")
+        ],
+        categories=[
+            category.get("term", "")
+            for category in entry.findall(f"{ATOM_NS}category")
+        ],
+        published=_normalize_timestamp(_text(entry, "published")),
+        abstract=_text(entry, "summary").strip(),
+        pdf_url=pdf_url,
+    )
+
+
+def _text(element: ET.Element, tag: str) -> str:
+    child = element.find(f"{ATOM_NS}{tag}")
+    if child is None or child.text is None:
+        return ""
+    return child.text
+
+
+def _collapse_whitespace(value: str) -> str:
+    return re.sub(r"\s+", " ", value).strip()
+
+
+def _normalize_timestamp(value: str) -> str:
+    """Render Atom timestamps the same way the `arxiv` package does."""
+    if not value:
+        return value
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).isoformat()
+    except ValueError:
+        return value
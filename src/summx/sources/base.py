@@ -1,19 +1,79 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Hashable, List
 
-from summx.models.paper import PaperMeta, PaperContentSections
-from summx.models.plan import SearchPlan
+from summx.models.paper import PaperContentSections, PaperMeta
+from summx.models.plan import DepthType, SearchPlan
 
 
 class PaperSourceClient(ABC):
-    """Abstract base class for a client that can retrieve paper data."""
+    """
+    Abstract base class for a client that can retrieve paper data.
+
+    Clients may hold long-lived resources (e.g. pooled HTTP connections), so they
+    support `aclose()` and can be used as async context managers.
+    """
 
     @abstractmethod
     async def search_papers(self, plan: SearchPlan) -> List[PaperMeta]:
         """Search for papers based on a search plan and return metadata."""
         pass
 
+    def search_key(self, plan: SearchPlan) -> Hashable:
+        """
+        Returns a key identifying the search a plan would run, so that equivalent
+        plans can share cached or in-flight results.
+        """
+        return (plan.filters.model_dump_json(), plan.sort, plan.limit)
+
+    @abstractmethod
+    async def fetch_papers(self, arxiv_ids: List[str]) -> List[PaperMeta]:
+        """Fetch metadata for the given paper IDs, in as few requests as possible."""
+        pass
+
     @abstractmethod
     async def read_paper(self, arxiv_id: str) -> PaperContentSections:
         """Read the content of a paper and return its sections."""
         pass
+
+    async def read_paper_from_meta(
+        self, meta: PaperMeta, depth: DepthType = "full"
+    ) -> PaperContentSections:
+        """
+        Read the content of a paper whose metadata is already known.
+
+        Sources that can use the metadata (e.g. its `pdf_url`) should override this
+        to avoid looking the paper up again. `depth` is a hint that only the parts
+        of the paper needed for that summarization depth are required.
+        """
+        return await self.read_paper(meta.arxiv_id)
+
+    async def prefetch_paper(self, meta: PaperMeta, depth: DepthType = "full") -> None:
+        """
+        Fetch whatever `read_paper_from_meta` will need (e.g. download the PDF)
+        ahead of time, so that I/O and parsing can be scheduled separately.
+        Sources without a separate download step can leave this as a no-op.
+        """
+        return None  # Optional hook: nothing to fetch ahead of time by default
+
+    async def read_papers(
+        self, metas: List[PaperMeta], depth: DepthType = "full"
+    ) -> List[PaperContentSections]:
+        """Read the content of several papers, preserving the input order."""
+        return list(
+            await asyncio.gather(
+                *(self.read_paper_from_meta(meta, depth=depth) for meta in metas)
+            )
+        )
+
+    async def aclose(self) -> None:
+        """Release any resources held by the client."""
+        return None  # Optional hook: clients without resources have nothing to do
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
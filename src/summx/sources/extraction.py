@@ -0,0 +1,170 @@
+import asyncio
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Union
+
+import fitz  # PyMuPDF
+
+from summx.models.paper import PaperContentSections
+from summx.models.plan import DepthType
+
+from .sections import TextLine, lines_from_page_dict, segment_lines
+
+# Bump whenever the extraction logic changes so cached content is re-extracted.
+EXTRACTOR_VERSION = "2"
+
+PdfSource = Union[bytes, str]
+
+
+# Pages read from the start of the paper for "abstract+intro+conclusion".
+LEADING_PAGES = 3
+# Pages read starting at the conclusion heading.
+CONCLUSION_PAGES = 2
+
+CONCLUSION_HEADING = re.compile(
+    r"^\s*(?:[\dIVX]+\.?\s*)?(?:conclusions?|concluding remarks|discussion)\b",
+    re.IGNORECASE | re.MULTILINE,
+)
+REFERENCES_HEADING = re.compile(
+    r"^\s*(?:references|bibliography)\s*$", re.IGNORECASE | re.MULTILINE
+)
+
+# Marks pages that were deliberately skipped in a partial extraction.
+SKIPPED_PAGES_MARKER = "\n[...]\n"
+
+
+def extract_pdf_sections(
+    source: PdfSource, depth: DepthType = "full"
+) -> PaperContentSections:
+    """
+    Extracts the text of a PDF, given its raw bytes or a path on disk, and
+    segments it into sections.
+
+    Only the pages needed for `depth` are parsed: the first page for "abstract",
+    the leading pages plus the pages around the conclusion for
+    "abstract+intro+conclusion", and everything for "full".
+
+    Prefer paths: PyMuPDF then reads pages from the file on demand rather than
+    holding the whole document in memory. This is a module-level function so that
+    it can be sent to worker processes.
+    """
+    if isinstance(source, bytes):
+        doc = fitz.open(stream=source, filetype="pdf")
+    else:
+        doc = fitz.open(source)
+
+    with doc:
+        parts = []
+        lines: List[TextLine] = []
+        previous = -1
+        for number in _select_pages(doc, depth):
+            if number != previous + 1:
+                parts.append(SKIPPED_PAGES_MARKER)
+            page_lines = lines_from_page_dict(doc[number].get_text("dict"))
+            parts.extend(line.text + "\n" for line in page_lines)
+            lines.extend(page_lines)
+            previous = number
+
+    return segment_lines(lines, full_text="".join(parts))
+
+
+def extract_pdf_text(source: PdfSource, depth: DepthType = "full") -> str:
+    """Extracts the plain text of the pages of a PDF needed for `depth`."""
+    return extract_pdf_sections(source, depth).full_text
+
+
+def _select_pages(doc: "fitz.Document", depth: DepthType) -> List[int]:
+    """Returns the (sorted) numbers of the pages to parse for `depth`."""
+    if depth == "full":
+        return list(range(doc.page_count))
+    if depth == "abstract":
+        return [0] if doc.page_count else []
+
+    pages = set(range(min(LEADING_PAGES, doc.page_count)))
+    start = _conclusion_page_from_outline(doc)
+    if start is None:
+        # Scan forward for the heading, stopping early at the references so that
+        # appendices are never parsed.
+        for number in range(LEADING_PAGES, doc.page_count):
+            text = doc[number].get_text()
+            if CONCLUSION_HEADING.search(text):
+                start = number
+                break
+            if REFERENCES_HEADING.search(text):
+                # No heading found; the conclusion usually sits just before.
+                start = max(number - 1, 0)
+                break
+
+    if start is not None:
+        pages.update(range(start, min(start + CONCLUSION_PAGES, doc.page_count)))
+    return sorted(pages)
+
+
+def _conclusion_page_from_outline(doc: "fitz.Document") -> Optional[int]:
+    """Finds the conclusion's page via the PDF outline, without parsing any pages."""
+    for _, title, page_number in doc.get_toc(simple=True):
+        if CONCLUSION_HEADING.search(title) and page_number >= 1:
+            return page_number - 1
+    return None
+
+
+class PdfExtractor:
+    """
+    Runs PDF text extraction off the event loop.
+
+    By default extraction runs in a pool of worker processes, so that parsing many
+    papers concurrently scales across cores instead of being serialized by the GIL.
+    With `max_workers=0` extraction runs in a worker thread instead, which avoids
+    process start-up costs for light workloads and tests.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_tasks_per_child: Optional[int] = None,
+    ):
+        """
+        Initializes the PdfExtractor. The process pool is started on first use.
+
+        Args:
+            max_workers: Number of worker processes; defaults to the CPU count.
+                Use 0 to extract in a thread instead of a process pool.
+            max_tasks_per_child: Restart a worker after this many extractions, which
+                bounds memory growth from long-lived PyMuPDF processes.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max_workers
+        self.max_tasks_per_child = max_tasks_per_child
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    async def extract(
+        self, source: PdfSource, depth: DepthType = "full"
+    ) -> PaperContentSections:
+        """Extracts the sections needed for `depth` from a PDF's bytes or its path."""
+        if self.max_workers == 0:
+            return await asyncio.to_thread(extract_pdf_sections, source, depth)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_pool(), extract_pdf_sections, source, depth
+        )
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                # "spawn" is safe in threaded, event-loop driven processes and is
+                # required for `max_tasks_per_child`.
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=self.max_tasks_per_child,
+            )
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Stops the worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
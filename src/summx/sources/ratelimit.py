@@ -0,0 +1,106 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, FrozenSet, Optional
+
+
+class TokenBucket:
+    """
+    An async token-bucket rate limiter.
+
+    Allows bursts of up to `burst` requests and `rate` requests per second on
+    average. It is implemented as a virtual schedule (GCRA) rather than with a lock:
+    `acquire` reserves the next free slot synchronously and then sleeps until it,
+    so callers are served in order and one instance can be shared by clients
+    running on different event loops.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            rate: Sustained requests per second.
+            burst: Requests allowed back-to-back when the bucket is full.
+            clock: Monotonic time source, injectable for testing.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._interval = 1.0 / rate
+        self._tolerance = (burst - 1) * self._interval
+        self._clock = clock
+        # Theoretical arrival time of the next request once the burst is used up.
+        self._next_slot = clock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        now = self._clock()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self._interval
+        return max(0.0, slot - self._tolerance - now)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for `seconds`, e.g. after a Retry-After."""
+        resume_at = self._clock() + seconds + self._tolerance
+        self._next_slot = max(self._next_slot, resume_at)
+
+
+_shared_buckets: Dict[str, TokenBucket] = {}
+
+
+def shared_bucket(name: str, rate: float, burst: int = 1) -> TokenBucket:
+    """
+    Return the process-wide TokenBucket called `name`, creating it on first use, so
+    every client talking to the same host draws from the same budget.
+    """
+    bucket = _shared_buckets.get(name)
+    if bucket is None or (bucket.rate, bucket.burst) != (rate, burst):
+        bucket = _shared_buckets[name] = TokenBucket(rate, burst)
+    return bucket
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How throttled or failed requests are retried."""
+
+    max_retries: int = 4
+    # Exponential backoff: attempt n waits up to base_delay * 2**n seconds.
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    # Retry-After values longer than this are not waited for; the request fails.
+    max_retry_after: float = 120.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+    def backoff(self, attempt: int) -> float:
+        """Jittered ("full jitter") exponential backoff for the given attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,157 @@
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from summx.models.paper import PaperContentSections
+
+# Maps normalized heading titles to PaperContentSections fields.
+SECTION_ALIASES = {
+    "abstract": "abstract",
+    "introduction": "introduction",
+    "method": "methods",
+    "methods": "methods",
+    "methodology": "methods",
+    "approach": "methods",
+    "our approach": "methods",
+    "proposed method": "methods",
+    "materials and methods": "methods",
+    "results": "results",
+    "experiments": "results",
+    "experimental results": "results",
+    "experiments and results": "results",
+    "evaluation": "results",
+    "results and discussion": "results",
+    "conclusion": "conclusion",
+    "conclusions": "conclusion",
+    "concluding remarks": "conclusion",
+    "discussion and conclusion": "conclusion",
+    "conclusion and future work": "conclusion",
+    "conclusions and future work": "conclusion",
+}
+STOP_SECTIONS = {"references", "bibliography", "acknowledgments", "acknowledgements"}
+
+# "3", "3.", "3.1" or "III." style numbering in front of a heading.
+_NUMBERING = re.compile(
+    r"^(?P<number>(?:\d+(?:\.\d+)*|[IVX]+)\.?)\s+(?P<title>.+)$"
+)
+_MAX_HEADING_WORDS = 8
+_BOLD_FLAG = 16
+
+
+@dataclass
+class TextLine:
+    """A line of text together with the font information used to spot headings."""
+
+    text: str
+    size: float
+    bold: bool
+
+
+def lines_from_page_dict(page_dict: dict) -> List[TextLine]:
+    """Flattens the output of PyMuPDF's `page.get_text("dict")` into TextLines."""
+    lines = []
+    for block in page_dict.get("blocks", []):
+        for line in block.get("lines", []):
+            spans = [span for span in line.get("spans", []) if span["text"].strip()]
+            if not spans:
+                continue
+            lines.append(
+                TextLine(
+                    text="".join(span["text"] for span in spans).strip(),
+                    size=max(span["size"] for span in spans),
+                    bold=all(
+                        span["flags"] & _BOLD_FLAG or "bold" in span["font"].lower()
+                        for span in spans
+                    ),
+                )
+            )
+    return lines
+
+
+def segment_lines(lines: List[TextLine], full_text: str) -> PaperContentSections:
+    """
+    Splits a paper's lines into sections by detecting headings from font size and
+    weight, and maps well-known headings onto PaperContentSections fields.
+
+    Subsection headings (e.g. "3.1 Setup") stay part of their parent section,
+    unrecognized headings before the first well-known section (typically the title
+    block) are ignored, and everything from the references onwards is dropped.
+    """
+    body_size = _body_font_size(lines)
+    sections: Dict[str, List[str]] = {}
+    current: Optional[str] = None
+
+    for line in lines:
+        heading = _heading_title(line, body_size)
+        if heading is not None:
+            key = heading.lower()
+            if key in STOP_SECTIONS:
+                break
+            if key not in SECTION_ALIASES and not sections:
+                continue
+            current = SECTION_ALIASES.get(key, heading)
+            sections.setdefault(current, [])
+            continue
+        if current is None and line.text.lower().startswith("abstract"):
+            # Many templates run the abstract label into its first sentence.
+            current = "abstract"
+            text = re.sub(r"^abstract[\s.:—-]*", "", line.text, flags=re.IGNORECASE)
+            sections.setdefault(current, []).append(text)
+            continue
+        if current is not None:
+            sections[current].append(line.text)
+
+    bodies = {name: _join(text) for name, text in sections.items() if _join(text)}
+    known = {"abstract", "introduction", "methods", "results", "conclusion"}
+    return PaperContentSections(
+        full_text=full_text,
+        abstract=bodies.get("abstract"),
+        introduction=bodies.get("introduction"),
+        methods=bodies.get("methods"),
+        results=bodies.get("results"),
+        conclusion=bodies.get("conclusion"),
+        other_sections={
+            name: body for name, body in bodies.items() if name not in known
+        },
+    )
+
+
+def _heading_title(line: TextLine, body_size: float) -> Optional[str]:
+    """Returns the heading's title if the line looks like a section heading."""
+    text = line.text.strip()
+    match = _NUMBERING.match(text)
+    number, title = ("", text)
+    if match:
+        number, title = match.group("number"), match.group("title")
+    title = title.strip().rstrip(".:")
+
+    if not title or not title[0].isalpha():
+        return None
+    if len(title.split()) > _MAX_HEADING_WORDS:
+        return None
+    # Subsections ("3.1 Setup") belong to their parent section.
+    if number.rstrip(".").count(".") > 0:
+        return None
+
+    larger = line.size >= body_size * 1.15
+    emphasized = line.bold and line.size >= body_size * 0.95
+    if larger or emphasized:
+        return title
+    # Plain-styled but numbered headings with a well-known title.
+    if number and title.lower() in {*SECTION_ALIASES, *STOP_SECTIONS}:
+        return title
+    return None
+
+
+def _body_font_size(lines: List[TextLine]) -> float:
+    """The most common font size, weighted by amount of text."""
+    sizes: Counter = Counter()
+    for line in lines:
+        sizes[round(line.size, 1)] += len(line.text)
+    return sizes.most_common(1)[0][0] if sizes else 0.0
+
+
+def _join(lines: List[str]) -> str:
+    return "\n".join(lines).strip()
+
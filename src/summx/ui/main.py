@@ -1,10 +1,8 @@
 import asyncio
 import streamlit as st
 
-from summx.agent import PaperAgent, PlanExecutor, QueryPlanner
+from summx.agent import build_agent
 from summx.config import load_config
-from summx.llm import get_llm
-from summx.sources import get_source_client
 
 # --- Page Config ---
 st.set_page_config(
@@ -18,13 +16,37 @@ st.set_page_config(
 # We don't cache the agent anymore, as it now depends on the UI's state.
 def get_agent(planner_provider, summarizer_provider):
     """Create the PaperAgent instance based on UI selections."""
-    config = load_config()
-    planner_llm = get_llm(provider=planner_provider, config=config)
-    summarizer_llm = get_llm(provider=summarizer_provider, config=config)
-    source_client = get_source_client(config=config)
-    planner = QueryPlanner(llm=planner_llm)
-    executor = PlanExecutor(source_client=source_client, summarizer_llm=summarizer_llm)
-    return PaperAgent(planner=planner, executor=executor)
+    return build_agent(
+        load_config(),
+        planner_provider=planner_provider,
+        summarizer_provider=summarizer_provider,
+    )
+
+
+async def run_agent(agent, query, on_plan, on_result):
+    """
+    Run a query, handing each result to `on_result` as soon as it is ready, and
+    release the agent's pooled connections afterwards. Returns the result count.
+    """
+    found = 0
+    async with agent:
+        async for result in agent.run_stream(query, on_plan=on_plan):
+            on_result(result)
+            found += 1
+    return found
+
+
+def render_result(slot, result):
+    """Render a single paper result into its placeholder."""
+    with slot.container():
+        st.subheader(f"{result.rank + 1}. {result.meta.title}")
+        authors = ", ".join(result.meta.authors)
+        st.caption(f"_by {authors}_ | Published: {result.meta.published}")
+        st.markdown(f"[Read PDF]({result.meta.pdf_url})")
+        if result.summary:
+            with st.expander("View Summary"):
+                st.markdown(result.summary.to_markdown())
+        st.divider()
 
 # --- UI Layout ---
 st.title("🤖 SummX: Your AI Research Assistant")
@@ -42,23 +64,25 @@ if st.button("Search"):
         st.warning("Please enter a search query.")
     else:
         agent = get_agent(planner_provider, summarizer_provider)
+        st.header("Results")
+        # One placeholder per expected result, so papers render in rank order
+        # even though they finish out of order.
+        slots = []
+
+        def on_plan(plan):
+            slots.extend(st.empty() for _ in range(plan.limit))
+
+        def on_result(result):
+            if result.rank >= len(slots):
+                slots.append(st.empty())
+            render_result(slots[result.rank], result)
+
         with st.spinner("Finding and summarizing papers..."):
             try:
                 # Run the agent's async method in Streamlit's event loop
-                plan, results = asyncio.run(agent.run(query))
-
-                st.header("Results")
-                if not results:
+                found = asyncio.run(run_agent(agent, query, on_plan, on_result))
+                if not found:
                     st.info("No papers found matching your query.")
-                else:
-                    for result in results:
-                        st.subheader(result.meta.title)
-                        st.caption(f"_by {', '.join(result.meta.authors)}_ | Published: {result.meta.published}")
-                        st.markdown(f"[Read PDF]({result.meta.pdf_url})")
-                        if result.summary:
-                            with st.expander("View Summary"):
-                                st.markdown(result.summary.to_markdown())
-                        st.divider()
 
             except Exception as e:
                 st.error(f"An error occurred: {e}")
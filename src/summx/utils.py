@@ -0,0 +1,37 @@
+import re
+from typing import List, Optional, Tuple
+
+_VERSION_SUFFIX = re.compile(r"^(?P<base>.+?)(?:v(?P<version>\d+))?$")
+# New-style ("2401.01234v2") and old-style ("hep-th/9901001") identifiers, bare or
+# inside arxiv.org/abs/ and arxiv.org/pdf/ URLs.
+_ARXIV_ID = re.compile(
+    r"(?<![\w.\-/])(?:(?:https?://)?(?:www\.|export\.)?arxiv\.org/(?:abs|pdf)/)?"
+    r"(?P<id>\d{4}\.\d{4,5}(?:v\d+)?|[a-z\-]+(?:\.[A-Z]{2})?/\d{7}(?:v\d+)?)"
+    r"(?:\.pdf)?(?![\w\-])"
+)
+
+
+def split_arxiv_id(arxiv_id: str) -> Tuple[str, Optional[int]]:
+    """
+    Splits an arXiv identifier into its base ID and version number.
+
+    "2305.12345v2" -> ("2305.12345", 2); "2305.12345" -> ("2305.12345", None).
+    """
+    match = _VERSION_SUFFIX.match(arxiv_id.strip())
+    if not match:
+        return arxiv_id, None
+    version = match.group("version")
+    return match.group("base"), int(version) if version else None
+
+
+def find_arxiv_ids(text: str) -> List[str]:
+    """
+    Finds arXiv identifiers in free text, including arxiv.org abstract and PDF URLs.
+
+    Returns the IDs in order of appearance, without duplicates.
+    """
+    ids: List[str] = []
+    for match in _ARXIV_ID.finditer(text):
+        if match.group("id") not in ids:
+            ids.append(match.group("id"))
+    return ids
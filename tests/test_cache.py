@@ -0,0 +1,118 @@
+import os
+import time
+
+from summx.cache import ContentStore, PdfStore, SearchCache, SummaryCache
+from summx.models import PaperContentSections, PaperMeta, PaperSummary
+
+
+def test_pdf_store_round_trip_and_stats(tmp_path):
+    """Stored PDFs are keyed by ID and version, and lookups are counted."""
+    store = PdfStore(tmp_path)
+
+    assert store.get("2305.12345v1") is None
+    path = store.put("2305.12345v1", b"%PDF-v1")
+
+    assert path.name == "2305.12345v1.pdf"
+    assert store.get("2305.12345v1").read_bytes() == b"%PDF-v1"
+    assert store.get("2305.12345v2") is None
+    assert store.path_for("hep-th/9901001").name == "hep-th_9901001.pdf"
+    assert not list(tmp_path.glob("*.part"))
+    assert (store.stats.hits, store.stats.misses) == (1, 2)
+
+
+def test_pdf_store_evicts_least_recently_used(tmp_path):
+    """Once over the size cap, the least recently used PDFs are removed first."""
+    store = PdfStore(tmp_path, max_bytes=25)
+    store.put("0001.00001", b"a" * 10)
+    store.put("0001.00002", b"b" * 10)
+    os.utime(store.path_for("0001.00001"), (1, 1))
+    os.utime(store.path_for("0001.00002"), (2, 2))
+
+    store.get("0001.00001")  # Refresh recency of the first paper
+    store.put("0001.00003", b"c" * 10)
+
+    assert store.contains("0001.00001")
+    assert not store.contains("0001.00002")
+    assert store.contains("0001.00003")
+    assert store.stats.evictions == 1
+    assert store.size_bytes() == 20
+
+
+def test_content_store_keys_and_invalidation(tmp_path):
+    """Content is keyed by ID, version and extractor version, and can be invalidated."""
+    store = ContentStore(tmp_path / "content.sqlite3")
+    content = PaperContentSections(full_text="Full text " * 100, abstract="Abstract")
+
+    store.put("2305.12345v1", "1", content)
+    store.put("2305.99999v1", "2", content)
+
+    assert store.get("2305.12345v1", "1") == content
+    assert store.get("2305.12345v2", "1") is None
+    assert store.get("2305.12345v1", "2") is None
+
+    assert store.invalidate_extractor("1") == 1
+    assert store.get("2305.12345v1", "1") is None
+    assert store.get("2305.99999v1", "2") == content
+    assert (store.stats.hits, store.stats.misses) == (2, 3)
+
+
+MOCK_SUMMARY = PaperSummary(
+    tldr=["TLDR"],
+    problem="Problem",
+    method="Method",
+    results="Results",
+    limitations="Limitations",
+    future_work="Future work",
+    raw_markdown="Summary",
+)
+
+
+def test_summary_cache_key_includes_model_and_depth():
+    """Changing the model, depth or prompt must produce a different key."""
+    make_key = SummaryCache.make_key
+    key = make_key("2305.12345v1", "groq", "llama", "abstract", "abc")
+
+    assert key != make_key("2305.12345v1", "groq", "other", "abstract", "abc")
+    assert key != make_key("2305.12345v1", "groq", "llama", "full", "abc")
+    assert key != make_key("2305.12345v1", "groq", "llama", "abstract", "def")
+    assert key != make_key("2305.12345v2", "groq", "llama", "abstract", "abc")
+
+
+def test_summary_cache_ttl_and_size_eviction(tmp_path):
+    """Entries expire after the TTL and the least recently used are evicted."""
+    cache = SummaryCache(tmp_path / "summaries.sqlite3", ttl_seconds=60, max_entries=2)
+
+    cache.put("a", MOCK_SUMMARY)
+    cache.put("b", MOCK_SUMMARY)
+    assert cache.get("a") == MOCK_SUMMARY  # "b" is now least recently used
+    cache.put("c", MOCK_SUMMARY)
+
+    assert cache.get("b") is None
+    assert cache.get("c") == MOCK_SUMMARY
+
+    cache.ttl_seconds = 0
+    time.sleep(0.01)
+    assert cache.get("a") is None
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 2
+
+
+def test_search_cache_ttl_depends_on_sort():
+    """most_recent results go stale sooner than relevance results."""
+    now = [0.0]
+    cache = SearchCache(
+        most_recent_ttl=10, relevance_ttl=100, max_stale=50, clock=lambda: now[0]
+    )
+    results = [
+        PaperMeta(arxiv_id="1", title="T", authors=[], categories=[], published="")
+    ]
+    cache.put("recent", "most_recent", results)
+    cache.put("relevant", "relevance", results)
+
+    now[0] = 20
+    assert cache.get("recent") == (results, True)
+    assert cache.get("relevant") == (results, False)
+
+    now[0] = 61
+    assert cache.get("recent") is None
+    assert cache.get("relevant") == (results, False)
@@ -18,6 +18,11 @@ MOCK_PAPER_LIST = [
         abstract="Abstract for paper 1.",
     )
 ]
+MOCK_SUMMARY_JSON = (
+    '{"tldr": ["TLDR"], "problem": "Problem", "method": "Method", '
+    '"results": "Results", "limitations": "Limitations", '
+    '"future_work": "Future work", "raw_markdown": "Summary"}'
+)
 
 @pytest.mark.asyncio
 async def test_plan_executor_fetches_and_summarizes():
@@ -27,9 +32,11 @@ async def test_plan_executor_fetches_and_summarizes():
     # 1. Setup: Create mocks for dependencies
     mock_source_client = AsyncMock(spec=PaperSourceClient)
     mock_source_client.search_papers.return_value = MOCK_PAPER_LIST
-    mock_source_client.read_paper.return_value = PaperContentSections(full_text="Abstract for paper 1.")
+    mock_source_client.read_paper_from_meta.return_value = PaperContentSections(
+        full_text="Abstract for paper 1."
+    )
 
-    mock_summarizer_llm = DummyLLMClient(response='{"tldr": ["TLDR"], "problem": "Problem", "method": "Method", "results": "Results", "limitations": "Limitations", "future_work": "Future work", "raw_markdown": "Summary"}')
+    mock_summarizer_llm = DummyLLMClient(response=MOCK_SUMMARY_JSON)
 
     # 2. Instantiate the executor with mocks
     executor = PlanExecutor(
@@ -41,7 +48,10 @@ async def test_plan_executor_fetches_and_summarizes():
 
     # 4. Assertions
     mock_source_client.search_papers.assert_called_once_with(MOCK_SEARCH_PLAN)
-    mock_source_client.read_paper.assert_called_once_with("1234.56789")
+    mock_source_client.read_paper_from_meta.assert_called_once_with(
+        MOCK_PAPER_LIST[0], depth="abstract+intro+conclusion"
+    )
+    mock_source_client.read_paper.assert_not_called()
     
     assert len(results) == 1
     result = results[0]
@@ -70,8 +80,323 @@ async def test_paper_agent_orchestrates_planning_and_execution():
     
     # 4. Assertions
     mock_planner.plan.assert_called_once_with(raw_query)
-    mock_executor.execute.assert_called_once_with(MOCK_SEARCH_PLAN)
+    mock_executor.execute.assert_called_once_with(MOCK_SEARCH_PLAN, None)
     
     assert plan == MOCK_SEARCH_PLAN
     assert len(results) == 1
     assert results[0].meta.title == "Test Paper 1"
+
+
+@pytest.mark.asyncio
+async def test_plan_executor_serves_summaries_from_cache(tmp_path):
+    """
+    A cached summary should skip both the paper download and the LLM call.
+    """
+    from summx.cache import SummaryCache
+
+    mock_source_client = AsyncMock(spec=PaperSourceClient)
+    mock_source_client.search_papers.return_value = MOCK_PAPER_LIST
+    mock_source_client.read_paper_from_meta.return_value = PaperContentSections(
+        full_text="Abstract for paper 1."
+    )
+    mock_summarizer_llm = DummyLLMClient(response=MOCK_SUMMARY_JSON)
+    mock_summarizer_llm.chat = AsyncMock(wraps=mock_summarizer_llm.chat)
+
+    executor = PlanExecutor(
+        source_client=mock_source_client,
+        summarizer_llm=mock_summarizer_llm,
+        summary_cache=SummaryCache(tmp_path / "summaries.sqlite3"),
+    )
+
+    first = await executor.execute(plan=MOCK_SEARCH_PLAN)
+    second = await executor.execute(plan=MOCK_SEARCH_PLAN)
+
+    assert mock_source_client.read_paper_from_meta.call_count == 1
+    assert mock_summarizer_llm.chat.call_count == 1
+    assert second[0].summary == first[0].summary
+    assert executor.summary_cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_error_outside_handlers_cancels_other_stages(tmp_path):
+    """A failing summary cache lookup fails the query and stops every stage."""
+    import asyncio
+    import sqlite3
+
+    from summx.cache import SummaryCache
+
+    mock_source_client = AsyncMock(spec=PaperSourceClient)
+    mock_source_client.search_papers.return_value = MOCK_PAPER_LIST * 3
+    mock_source_client.read_paper_from_meta.return_value = PaperContentSections(
+        full_text="Abstract for paper 1."
+    )
+    summary_cache = SummaryCache(tmp_path / "summaries.sqlite3")
+    summary_cache.get = MagicMock(side_effect=sqlite3.OperationalError("disk full"))
+    executor = PlanExecutor(
+        source_client=mock_source_client,
+        summarizer_llm=DummyLLMClient(
+            response='{"problem": "Problem", "method": "Method", "results": "Results"}'
+        ),
+        summary_cache=summary_cache,
+    )
+
+    with pytest.raises(sqlite3.OperationalError, match="disk full"):
+        await asyncio.wait_for(executor.execute(plan=MOCK_SEARCH_PLAN), timeout=5)
+    # No stage worker is left waiting on its queue
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_summaries_from_a_fallback_provider_are_not_cached(tmp_path):
+    """The cache key names the primary model, so a fallback's answer isn't stored."""
+    from summx.cache import SummaryCache
+    from summx.llm import HedgedLLMClient
+
+    class BrokenLLMClient(DummyLLMClient):
+        async def chat(self, messages):
+            raise RuntimeError("Error calling Groq API")
+
+    primary = BrokenLLMClient()
+    primary.provider, primary.model = "groq", "llama"
+    fallback = DummyLLMClient(
+        response='{"problem": "Problem", "method": "Method", "results": "Results", '
+        '"limitations": "Limits", "future_work": "More", "raw_markdown": "Summary"}'
+    )
+    mock_source_client = AsyncMock(spec=PaperSourceClient)
+    mock_source_client.search_papers.return_value = MOCK_PAPER_LIST
+    mock_source_client.read_paper_from_meta.return_value = PaperContentSections(
+        full_text="Abstract for paper 1."
+    )
+    executor = PlanExecutor(
+        source_client=mock_source_client,
+        summarizer_llm=HedgedLLMClient([primary, fallback]),
+        summary_cache=SummaryCache(tmp_path / "summaries.sqlite3"),
+    )
+
+    results = await executor.execute(plan=MOCK_SEARCH_PLAN)
+
+    assert results[0].summary.problem == "Problem"
+    key = executor._summary_cache_key(MOCK_PAPER_LIST[0], MOCK_SEARCH_PLAN)
+    assert executor.summary_cache.get(key) is None
+
+
+def test_summary_input_uses_only_requested_sections():
+    """The LLM input should be trimmed to the sections the depth asks for."""
+    executor = PlanExecutor(
+        source_client=AsyncMock(spec=PaperSourceClient), summarizer_llm=DummyLLMClient()
+    )
+    content = PaperContentSections(
+        full_text="everything",
+        abstract="The abstract.",
+        introduction="The intro.",
+        methods="The methods.",
+        conclusion="The conclusion.",
+    )
+
+    partial = executor._build_summary_input(content, "abstract+intro+conclusion")
+    assert "The intro." in partial and "The conclusion." in partial
+    assert "The methods." not in partial
+    abstract_only = executor._build_summary_input(content, "abstract")
+    assert abstract_only == "## Abstract\nThe abstract."
+    assert "The methods." in executor._build_summary_input(content, "full")
+
+    unsegmented = PaperContentSections(full_text="everything", abstract="The abstract.")
+    assert executor._build_summary_input(unsegmented, "full") == "everything"
+
+
+@pytest.mark.asyncio
+async def test_pipeline_bounds_each_stage_and_keeps_rank_order():
+    """Each stage respects its own concurrency limit; results stay in search order."""
+    import asyncio
+
+    papers = [
+        MOCK_PAPER_LIST[0].model_copy(update={"arxiv_id": f"2501.{i:05d}"})
+        for i in range(6)
+    ]
+    active = {"download": 0, "extract": 0}
+    peak = {"download": 0, "extract": 0}
+
+    def tracked(stage, result=None):
+        async def run(meta, depth):
+            active[stage] += 1
+            peak[stage] = max(peak[stage], active[stage])
+            # Later papers finish first to exercise re-ordering
+            await asyncio.sleep(0.01 * (6 - int(meta.arxiv_id[-1])))
+            active[stage] -= 1
+            if meta.arxiv_id.endswith("3") and stage == "extract":
+                raise RuntimeError("broken pdf")
+            return result
+        return run
+
+    mock_source_client = AsyncMock(spec=PaperSourceClient)
+    mock_source_client.search_papers.return_value = papers
+    mock_source_client.prefetch_paper.side_effect = tracked("download")
+    mock_source_client.read_paper_from_meta.side_effect = tracked(
+        "extract", PaperContentSections(full_text="text")
+    )
+
+    executor = PlanExecutor(
+        source_client=mock_source_client,
+        summarizer_llm=DummyLLMClient(),
+        download_concurrency=3,
+        extract_concurrency=2,
+        summarize_concurrency=1,
+    )
+    results = await executor.execute(plan=MOCK_SEARCH_PLAN)
+
+    assert [r.meta.arxiv_id for r in results] == [p.arxiv_id for p in papers]
+    assert peak["download"] <= 3 and peak["extract"] <= 2
+    assert results[3].summary is None
+    assert all(r.summary is not None for i, r in enumerate(results) if i != 3)
+
+
+@pytest.mark.asyncio
+async def test_run_stream_yields_results_as_they_complete():
+    """Streaming should yield papers in completion order, tagged with their rank."""
+    import asyncio
+
+    papers = [
+        MOCK_PAPER_LIST[0].model_copy(update={"arxiv_id": f"2501.{i:05d}"})
+        for i in range(3)
+    ]
+
+    async def read(meta, depth):
+        # The first paper is the slowest
+        await asyncio.sleep(0.03 if meta.arxiv_id.endswith("0") else 0.0)
+        return PaperContentSections(full_text="text")
+
+    mock_source_client = AsyncMock(spec=PaperSourceClient)
+    mock_source_client.search_papers.return_value = papers
+    mock_source_client.read_paper_from_meta.side_effect = read
+    mock_planner = AsyncMock(spec=QueryPlanner)
+    mock_planner.plan.return_value = MOCK_SEARCH_PLAN
+    agent = PaperAgent(
+        planner=mock_planner,
+        executor=PlanExecutor(
+            source_client=mock_source_client, summarizer_llm=DummyLLMClient()
+        ),
+    )
+
+    plans = []
+    ranks = [r.rank async for r in agent.run_stream("test query", on_plan=plans.append)]
+
+    assert plans == [MOCK_SEARCH_PLAN]
+    assert sorted(ranks) == [0, 1, 2]
+    assert ranks[-1] == 0
+
+
+@pytest.mark.asyncio
+async def test_abstract_depth_summarizes_from_metadata_without_pdf():
+    """Abstract-depth plans should never download or parse the PDF."""
+    mock_source_client = AsyncMock(spec=PaperSourceClient)
+    mock_source_client.search_papers.return_value = MOCK_PAPER_LIST
+    mock_summarizer_llm = DummyLLMClient()
+    mock_summarizer_llm.chat = AsyncMock(wraps=mock_summarizer_llm.chat)
+    executor = PlanExecutor(
+        source_client=mock_source_client, summarizer_llm=mock_summarizer_llm
+    )
+    plan = SearchPlan(raw_query="test query", summarization={"depth": "abstract"})
+
+    results = await executor.execute(plan=plan)
+
+    mock_source_client.prefetch_paper.assert_not_called()
+    mock_source_client.read_paper_from_meta.assert_not_called()
+    assert results[0].content.abstract == "Abstract for paper 1."
+    assert results[0].summary is not None
+    messages = mock_summarizer_llm.chat.call_args.args[0]
+    assert "Abstract for paper 1." in messages[-1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_abstract_depth_batches_summaries():
+    """Abstract-depth papers are summarized in batches of summary_batch_size."""
+    papers = [
+        MOCK_PAPER_LIST[0].model_copy(update={"arxiv_id": f"2501.{i:05d}"})
+        for i in range(3)
+    ]
+    mock_source_client = AsyncMock(spec=PaperSourceClient)
+    mock_source_client.search_papers.return_value = papers
+    executor = PlanExecutor(
+        source_client=mock_source_client,
+        summarizer_llm=DummyLLMClient(),
+        summary_batch_size=2,
+    )
+    executor.summarizer.summarize_batch = AsyncMock(
+        wraps=executor.summarizer.summarize_batch
+    )
+    plan = SearchPlan(raw_query="test query", summarization={"depth": "abstract"})
+
+    results = await executor.execute(plan=plan)
+
+    assert [r.rank for r in results] == [0, 1, 2]
+    assert all(r.summary is not None for r in results)
+    executor.summarizer.summarize_batch.assert_called_once()
+    assert len(executor.summarizer.summarize_batch.call_args.args[0]) == 2
+
+
+@pytest.mark.asyncio
+async def test_arxiv_ids_in_query_skip_planner_and_search():
+    """Queries naming arXiv IDs or URLs fetch those papers in one batched lookup."""
+    llm = DummyLLMClient()
+    llm.chat = AsyncMock(wraps=llm.chat)
+    mock_source_client = AsyncMock(spec=PaperSourceClient)
+    # arXiv returns versioned IDs, in its own order
+    mock_source_client.fetch_papers.return_value = [
+        MOCK_PAPER_LIST[0].model_copy(update={"arxiv_id": "2305.12345v1"}),
+        MOCK_PAPER_LIST[0].model_copy(update={"arxiv_id": "2401.01234v3"}),
+    ]
+    executor = PlanExecutor(
+        source_client=mock_source_client, summarizer_llm=DummyLLMClient()
+    )
+    agent = PaperAgent(planner=QueryPlanner(llm=llm), executor=executor)
+
+    plan, results = await agent.run(
+        "summarize 2401.01234 and https://arxiv.org/pdf/2305.12345v1.pdf "
+        "without summarizing"
+    )
+
+    assert plan.intent == "summarize_ids"
+    assert plan.arxiv_ids == ["2401.01234", "2305.12345v1"]
+    assert plan.summarization.enabled is False
+    llm.chat.assert_not_called()
+    mock_source_client.search_papers.assert_not_called()
+    mock_source_client.fetch_papers.assert_called_once_with(
+        ["2401.01234", "2305.12345v1"]
+    )
+    assert [r.meta.arxiv_id for r in results] == ["2401.01234v3", "2305.12345v1"]
+
+
+@pytest.mark.asyncio
+async def test_speculative_search_is_reused_only_when_plan_matches():
+    """A speculative search is used on a matching plan and cancelled otherwise."""
+    import json
+
+    def planner_llm(topic):
+        plan = {"filters": {"topic": topic}, "sort": "most_recent", "limit": 5}
+        return DummyLLMClient(response=json.dumps(plan))
+
+    mock_source_client = AsyncMock(spec=PaperSourceClient)
+    mock_source_client.search_key.side_effect = (
+        lambda plan: PaperSourceClient.search_key(mock_source_client, plan)
+    )
+    mock_source_client.search_papers.return_value = MOCK_PAPER_LIST
+    executor = PlanExecutor(
+        source_client=mock_source_client, summarizer_llm=DummyLLMClient()
+    )
+    query = "five most recent papers on hyper graphs without summarizing"
+
+    planner = QueryPlanner(llm=planner_llm("hyper graphs"))
+    agent = PaperAgent(planner, executor, speculative=True)
+    _, results = await agent.run(query)
+    assert len(results) == 1
+    assert mock_source_client.search_papers.call_count == 1
+
+    planner = QueryPlanner(llm=planner_llm("hypergraphs"))
+    agent = PaperAgent(planner, executor, speculative=True)
+    await agent.run(query)
+    searched = [
+        call.args[0].filters.topic
+        for call in mock_source_client.search_papers.call_args_list
+    ]
+    assert searched[-1] == "hypergraphs"
+    assert (agent.speculation_stats.hits, agent.speculation_stats.misses) == (0, 1)
@@ -61,4 +61,177 @@ def test_get_llm_factory_unknown_provider():
     """Tests that the factory raises a ValueError for an unknown provider."""
     config = load_config()
     with pytest.raises(ValueError, match="Unsupported LLM provider: fake_provider"):
-        get_llm(provider="fake_provider", config=config) # type: ignore
\ No newline at end of file
+        get_llm(provider="fake_provider", config=config) # type: ignore
+
+@pytest.mark.asyncio
+async def test_dummy_llm_client_streams_response():
+    """Streaming yields the canned response in pieces that join back together."""
+    client = DummyLLMClient(response="a streamed  response")
+    pieces = [piece async for piece in client.chat_stream(messages=[])]
+    assert len(pieces) == 3
+    assert "".join(pieces) == "a streamed  response"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("client_cls", [OpenAIClient, GroqClient])
+async def test_provider_chat_stream_yields_deltas(client_cls):
+    """Provider clients request a stream and yield the content deltas."""
+    import json
+
+    import httpx
+
+    def chunk(content):
+        delta = {"index": 0, "delta": {"content": content}, "finish_reason": None}
+        return "data: " + json.dumps({
+            "id": "1", "object": "chat.completion.chunk", "created": 0, "model": "m",
+            "choices": [delta],
+        }) + "\n\n"
+
+    requests = []
+
+    def handler(request):
+        requests.append(json.loads(request.content))
+        body = chunk("Hello") + chunk(" world") + "data: [DONE]\n\n"
+        headers = {"content-type": "text/event-stream"}
+        return httpx.Response(200, text=body, headers=headers)
+
+    client = client_cls(api_key="fake-key", model="m")
+    client.client = client.client.with_options(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        max_retries=0,
+    )
+
+    messages = [{"role": "user", "content": "hi"}]
+    pieces = [piece async for piece in client.chat_stream(messages)]
+
+    assert pieces == ["Hello", " world"]
+    assert requests[0]["stream"] is True
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('Here you go:\n```json\n{"a": 1, "b": [1, 2,],}\n```', {"a": 1, "b": [1, 2]}),
+        (
+            "{'a': 'it\\'s', b: True, // note\n 'c': None}",
+            {"a": "it's", "b": True, "c": None},
+        ),
+        ('{"a": "line 1\nline 2"} trailing prose {"b": 2}', {"a": "line 1\nline 2"}),
+        (
+            '{"raw_markdown": "Example:\\n```python\\nprint(1)\\n```"}',
+            {"raw_markdown": "Example:\n```python\nprint(1)\n```"},
+        ),
+        (
+            '[{"id": "P1"}, {"id": "P2", "tldr": ["cut',
+            [{"id": "P1"}, {"id": "P2", "tldr": ["cut"]}],
+        ),
+    ],
+)
+def test_loads_tolerant_repairs_common_mistakes(text, expected):
+    from summx.llm import loads_tolerant
+
+    assert loads_tolerant(text) == expected
+
+
+def test_loads_tolerant_rejects_text_without_json():
+    import json
+
+    from summx.llm import loads_tolerant
+
+    with pytest.raises(json.JSONDecodeError):
+        loads_tolerant("This is not valid JSON.")
+
+
+@pytest.mark.asyncio
+async def test_openai_chat_structured_sends_json_schema():
+    """The OpenAI client constrains output with the model's JSON schema."""
+    import json
+
+    import httpx
+
+    from summx.models import PaperSummary
+
+    requests = []
+
+    def handler(request):
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, json={
+            "id": "1", "object": "chat.completion", "created": 0, "model": "m",
+            "choices": [{
+                "index": 0, "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "{}"},
+            }],
+        })
+
+    client = OpenAIClient(api_key="fake-key", model="m")
+    client.client = client.client.with_options(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        max_retries=0,
+    )
+
+    assert await client.chat_structured([], PaperSummary) == "{}"
+    response_format = requests[0]["response_format"]
+    assert response_format["type"] == "json_schema"
+    assert response_format["json_schema"]["schema"] == PaperSummary.model_json_schema()
+
+
+class SlowLLMClient(LLMClient):
+    """Answers after `delay` seconds, or raises `error` if given."""
+
+    def __init__(self, name, delay=0.0, error=None):
+        self.provider = name
+        self.model = name
+        self.delay = delay
+        self.error = error
+        self.started = 0
+        self.cancelled = 0
+
+    async def chat(self, messages):
+        import asyncio
+
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise self.error
+        return self.provider
+
+
+@pytest.mark.asyncio
+async def test_hedged_client_hedges_slow_calls_and_cancels_loser():
+    from summx.llm import HedgedLLMClient
+
+    slow, fast = SlowLLMClient("slow", delay=1.0), SlowLLMClient("fast", delay=0.01)
+    client = HedgedLLMClient([slow, fast], initial_hedge_delay=0.02)
+
+    assert await client.chat([]) == "fast"
+    assert client.hedges == 1
+    assert slow.cancelled == 1
+    assert (client.provider, client.model) == ("slow", "slow")
+
+    # The fast provider is now preferred
+    assert await client.chat([]) == "fast"
+    assert slow.started == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_client_times_out_and_fails_over():
+    from summx.llm import HedgedLLMClient, record_answering_providers
+
+    stalled = SlowLLMClient("stalled", delay=10)
+    broken = SlowLLMClient("broken", error=RuntimeError("Error calling Groq API"))
+    backup = SlowLLMClient("backup")
+
+    client = HedgedLLMClient([stalled, backup], timeout=0.05, initial_hedge_delay=10)
+    assert await client.chat([]) == "backup"
+
+    client = HedgedLLMClient([broken, backup])
+    with record_answering_providers() as answered:
+        assert await client.chat([]) == "backup"
+    assert answered == {("backup", "backup")}
+
+    with pytest.raises(RuntimeError, match="All LLM providers failed"):
+        await HedgedLLMClient([broken], timeout=0.05).chat([])
@@ -1,6 +1,10 @@
 import json
+from unittest.mock import AsyncMock
+
 import pytest
-from summx.agent.planner import QueryPlanner
+
+from summx.agent.planner import QueryPlanner, RuleBasedPlanner
+from summx.cache import PlanCache, normalize_query
 from summx.llm import DummyLLMClient
 from summx.models import SearchPlan
 
@@ -27,14 +31,14 @@ async def test_query_planner_success():
     """
     # 1. Setup: Create a dummy LLM that returns our mock JSON
     dummy_llm = DummyLLMClient(response=json.dumps(MOCK_PLAN_JSON))
-    
+
     # 2. Instantiate the planner
     planner = QueryPlanner(llm=dummy_llm)
-    
+
     # 3. Run the plan method
     raw_query = "five most recent papers on hyper graphs"
     search_plan = await planner.plan(raw_query=raw_query)
-    
+
     # 4. Assertions: Check if the SearchPlan object is correct
     assert isinstance(search_plan, SearchPlan)
     assert search_plan.raw_query == raw_query
@@ -51,7 +55,157 @@ async def test_query_planner_invalid_json():
     # 1. Setup: Dummy LLM returns a non-JSON string
     dummy_llm = DummyLLMClient(response="This is not valid JSON.")
     planner = QueryPlanner(llm=dummy_llm)
-    
+
     # 2. Run and assert that it raises the expected exception
     with pytest.raises(ValueError, match="Failed to parse LLM response"):
         await planner.plan(raw_query="any query")
+
+
+def test_normalize_query_folds_trivial_differences():
+    """Case, whitespace, number words and synonyms should not change the key."""
+    assert normalize_query("5 recent papers on GNNs") == normalize_query(
+        "  Five most   recent papers on GNNs?"
+    )
+    assert normalize_query("papers on GNNs") != normalize_query("papers on CNNs")
+
+
+def test_normalize_query_keeps_plus_and_hash():
+    keys = {normalize_query(f"papers on {topic}") for topic in ("C", "C++", "C#")}
+
+    assert len(keys) == 3
+
+
+@pytest.mark.asyncio
+async def test_query_planner_uses_plan_cache(tmp_path):
+    """
+    Repeat queries should be served from the cache, with the summarization
+    override still applied to the new query.
+    """
+    llm_plan = {**MOCK_PLAN_JSON, "summarization": {"enabled": False}}
+    dummy_llm = DummyLLMClient(response=json.dumps(llm_plan))
+    dummy_llm.chat = AsyncMock(wraps=dummy_llm.chat)
+    cache = PlanCache(path=tmp_path / "plans.sqlite3")
+    planner = QueryPlanner(llm=dummy_llm, cache=cache)
+
+    first = await planner.plan("five most recent papers on GNNs")
+    second = await planner.plan("5 recent papers on gnns, don't summarize")
+    # A fresh in-process tier should still hit the persistent tier
+    planner.cache = PlanCache(path=tmp_path / "plans.sqlite3")
+    third = await planner.plan("5 recent papers on GNNs")
+
+    assert dummy_llm.chat.call_count == 2
+    assert first.summarization.enabled is True
+    assert second.raw_query == "5 recent papers on gnns, don't summarize"
+    assert second.summarization.enabled is False
+    assert third.filters.topic == "hyper graphs"
+    assert third.summarization.enabled is True
+
+
+@pytest.mark.asyncio
+async def test_query_planner_repairs_malformed_json():
+    """Fenced JSON with trailing commas should still produce a plan."""
+    plan_json = json.dumps(MOCK_PLAN_JSON).replace("5,", "5, // five\n").rstrip("}")
+    response = "```json\n" + plan_json + ",}\n```"
+    planner = QueryPlanner(llm=DummyLLMClient(response=response))
+
+    search_plan = await planner.plan("five most recent papers on hyper graphs")
+
+    assert search_plan.limit == 5
+    assert search_plan.filters.topic == "hyper graphs"
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        (
+            "five most recent papers on hyper graphs",
+            {"filters": {"topic": "hyper graphs"}, "sort": "most_recent", "limit": 5},
+        ),
+        (
+            "find papers by Laszlo Lovasz from 2022",
+            {
+                "filters": {
+                    "author": "Laszlo Lovasz",
+                    "date_from": "2022-01-01",
+                    "date_to": "2022-12-31",
+                },
+                "limit": 5,
+            },
+        ),
+        (
+            "show me the top 3 most relevant papers on diffusion models "
+            "without summarizing them",
+            {
+                "filters": {"topic": "diffusion models"},
+                "sort": "relevance",
+                "limit": 3,
+                "summarization": {"enabled": False},
+            },
+        ),
+    ],
+)
+def test_rule_based_planner_handles_prompt_examples(query, expected):
+    plan = RuleBasedPlanner().plan(query)
+
+    assert plan is not None
+    dumped = plan.model_dump(exclude_none=True)
+    for field, value in expected.items():
+        if isinstance(value, dict):
+            assert {k: dumped[field].get(k) for k in value} == value
+        else:
+            assert dumped[field] == value
+
+
+@pytest.mark.asyncio
+async def test_query_planner_uses_rules_and_falls_back_to_llm():
+    """Confident rule matches skip the LLM; anything else still reaches it."""
+    dummy_llm = DummyLLMClient(response=json.dumps(MOCK_PLAN_JSON))
+    dummy_llm.chat = AsyncMock(wraps=dummy_llm.chat)
+    rules = RuleBasedPlanner()
+    planner = QueryPlanner(llm=dummy_llm, rules=rules)
+
+    plan = await planner.plan("10 latest papers about learning on graphs in 2023")
+    assert plan.filters.topic == "learning on graphs"
+    assert plan.limit == 10
+    dummy_llm.chat.assert_not_called()
+
+    await planner.plan("papers on graph neural networks but not transformers")
+    dummy_llm.chat.assert_called_once()
+    assert (rules.stats.hits, rules.stats.misses) == (1, 1)
+    assert rules.stats.hit_rate == 0.5
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "most recent papers on LLMs from last month",
+        "papers on diffusion models in the last year",
+        "recent papers on GNNs published this week",
+        "papers on transformers since last summer",
+        "papers on learning by demonstration",
+        "papers about graphs regarding something",
+    ],
+)
+def test_rule_based_planner_declines_dates_it_cannot_read(query):
+    """Relative dates and stray verbs must go to the LLM, not into the topic."""
+    plan, confidence = RuleBasedPlanner().parse(query)
+
+    assert plan is None and confidence == 0.0
+
+
+@pytest.mark.parametrize(
+    "query, limit",
+    [
+        ("a dozen papers on GNNs", 12),
+        ("a couple of  recent papers on GNNs", 2),
+        ("A few papers on GNNs", 3),
+        ("adozen papers on GNNs", None),
+        ("afew papers on GNNs", None),
+        ("0 papers on GNNs", None),
+    ],
+)
+def test_rule_based_planner_reads_multi_word_counts(query, limit):
+    """Multi-word counts are matched with their spaces; typos and 0 are declined."""
+    plan, _ = RuleBasedPlanner().parse(query)
+
+    assert (plan.limit if plan else None) == limit
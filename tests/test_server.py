@@ -0,0 +1,100 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from summx.agent import PaperAgent, PlanExecutor, QueryPlanner
+from summx.client import stream_query
+from summx.llm import DummyLLMClient
+from summx.models import PaperMeta, SearchPlan
+from summx.server import SummXServer
+from summx.sources.base import PaperSourceClient
+
+MOCK_PAPERS = [
+    PaperMeta(
+        arxiv_id=f"2501.0000{i}",
+        title=f"Test Paper {i}",
+        authors=["Author A"],
+        categories=["cs.AI"],
+        published="2025-01-01",
+        abstract="An abstract.",
+    )
+    for i in range(2)
+]
+
+
+@pytest.fixture
+async def server_socket(tmp_path):
+    """Runs a SummXServer over a Unix socket with a mocked agent."""
+    source_client = AsyncMock(spec=PaperSourceClient)
+    source_client.search_papers.return_value = MOCK_PAPERS
+    planner = AsyncMock(spec=QueryPlanner)
+    planner.plan.return_value = SearchPlan(
+        raw_query="test query", summarization={"depth": "abstract"}
+    )
+    executor = PlanExecutor(
+        source_client=source_client, summarizer_llm=DummyLLMClient()
+    )
+    agent = PaperAgent(planner=planner, executor=executor)
+
+    path = tmp_path / "summx.sock"
+    task = asyncio.create_task(SummXServer(agent).serve(unix_socket=path))
+    while not path.exists():
+        await asyncio.sleep(0.01)
+    yield path
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_server_streams_query_events(server_socket):
+    """Concurrent queries each receive the plan, every result and a done event."""
+
+    async def collect():
+        events = stream_query(f"unix:{server_socket}", "test query")
+        return [event async for event in events]
+
+    first, second = await asyncio.gather(collect(), collect())
+
+    for events in (first, second):
+        assert events[0]["plan"]["raw_query"] == "test query"
+        ids = sorted(event["result"]["meta"]["arxiv_id"] for event in events[1:-1])
+        assert ids == ["2501.00000", "2501.00001"]
+        assert events[-1] == {"done": True, "count": 2}
+
+
+@pytest.mark.asyncio
+async def test_server_rejects_bad_requests(server_socket):
+    transport = httpx.AsyncHTTPTransport(uds=str(server_socket))
+    client = httpx.AsyncClient(transport=transport, base_url="http://summx")
+    async with client:
+        assert (await client.get("/health")).json() == {"status": "ok"}
+        assert (await client.get("/missing")).status_code == 404
+        response = await client.post("/query", content=json.dumps({"q": 1}))
+        assert response.status_code == 400
+
+    with pytest.raises(RuntimeError, match="400"):
+        async for _ in stream_query(f"unix:{server_socket}", " "):
+            pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_head",
+    [
+        b"POST /query HTTP/1.1\r\nContent-Length: -1\r\n\r\n",
+        b"GET /health HTTP/1.1\r\nX-Long: " + b"a" * 100_000 + b"\r\n\r\n",
+    ],
+    ids=["negative-content-length", "overlong-header"],
+)
+async def test_server_answers_malformed_headers_with_400(server_socket, request_head):
+    reader, writer = await asyncio.open_unix_connection(str(server_socket))
+    writer.write(request_head)
+    await writer.drain()
+
+    status_line = await asyncio.wait_for(reader.readline(), timeout=5)
+    writer.close()
+
+    assert status_line.startswith(b"HTTP/1.1 400")
@@ -1,10 +1,15 @@
-import pytest
-from unittest.mock import patch, MagicMock
 from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
 
-from summx.sources.arxiv_api_client import ArxivApiClient
-from summx.models.plan import SearchPlan, SearchFilters
 from summx.models.paper import PaperMeta
+from summx.models.plan import SearchFilters, SearchPlan
+from summx.sources.arxiv_api_client import ArxivApiClient
+from summx.sources.arxiv_atom import AtomFeedParser
+from summx.sources.ratelimit import RetryPolicy, TokenBucket, parse_retry_after
+
 
 # Helper to create a mock author object, as expected by the arxiv library
 class MockAuthor:
@@ -36,7 +41,7 @@ async def test_arxiv_api_client_search_papers(mock_arxiv_search):
     mock_instance.results.return_value = [create_mock_arxiv_result()]
 
     # 2. Instantiate the client and create a search plan
-    client = ArxivApiClient()
+    client = ArxivApiClient(search_backend="arxiv")
     plan = SearchPlan(
         filters=SearchFilters(topic="test topic", author="test author"),
         limit=5,
@@ -61,3 +66,456 @@ async def test_arxiv_api_client_search_papers(mock_arxiv_search):
     assert paper_meta.title == "Test Paper"
     assert paper_meta.authors == ["Dr. Mock Author"]
     assert paper_meta.published == "2023-05-20T18:00:00"
+
+
+MOCK_ATOM_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title>arXiv Query</title>
+  <entry>
+    <id>http://arxiv.org/abs/2305.12345v1</id>
+    <published>2023-05-20T18:00:00Z</published>
+    <title>Test
+      Paper</title>
+    <summary>  This is a test abstract.
+</summary>
+    <author><name>Dr. Mock Author</name></author>
+    <author><name>Second Author</name></author>
+    <link href="http://arxiv.org/abs/2305.12345v1" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2305.12345v1" rel="related"
+          type="application/pdf"/>
+    <arxiv:primary_category term="cs.AI"/>
+    <category term="cs.AI"/>
+    <category term="cs.LG"/>
+  </entry>
+</feed>
+"""
+
+
+def test_atom_feed_parser_is_incremental():
+    """Entries should be returned as soon as their closing tag has been fed."""
+    parser = AtomFeedParser()
+    split = MOCK_ATOM_FEED.index(b"</entry>")
+
+    assert parser.feed(MOCK_ATOM_FEED[:split]) == []
+    papers = parser.feed(MOCK_ATOM_FEED[split:])
+    assert parser.close() == []
+
+    assert len(papers) == 1
+    paper = papers[0]
+    assert paper.arxiv_id == "2305.12345v1"
+    assert paper.title == "Test Paper"
+    assert paper.authors == ["Dr. Mock Author", "Second Author"]
+    assert paper.categories == ["cs.AI", "cs.LG"]
+    assert paper.published == "2023-05-20T18:00:00+00:00"
+    assert paper.abstract == "This is a test abstract."
+    assert paper.pdf_url == "http://arxiv.org/pdf/2305.12345v1"
+
+
+@pytest.mark.asyncio
+async def test_arxiv_api_client_async_search():
+    """The httpx backend should query the Atom API without the arxiv package."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=MOCK_ATOM_FEED)
+
+    client = ArxivApiClient(transport=httpx.MockTransport(handler))
+    plan = SearchPlan(
+        filters=SearchFilters(topic="test topic"),
+        limit=3,
+        sort="relevance",
+        raw_query="test",
+    )
+
+    with patch("summx.sources.arxiv_api_client.arxiv.Search") as mock_arxiv_search:
+        results = await client.search_papers(plan)
+        mock_arxiv_search.assert_not_called()
+
+    assert len(requests) == 1
+    params = requests[0].url.params
+    assert params["search_query"] == 'ti:"test topic"'
+    assert params["max_results"] == "3"
+    assert params["sortBy"] == "relevance"
+    assert [paper.arxiv_id for paper in results] == ["2305.12345v1"]
+
+
+@pytest.mark.asyncio
+@patch("summx.sources.arxiv_api_client.arxiv.Search")
+async def test_arxiv_api_client_falls_back_to_arxiv_package(mock_arxiv_search):
+    """A failing async search should fall back to the arxiv package."""
+    mock_arxiv_search.return_value.results.return_value = [create_mock_arxiv_result()]
+    client = ArxivApiClient(
+        retry=RetryPolicy(max_retries=0),
+        transport=httpx.MockTransport(lambda request: httpx.Response(503)),
+    )
+
+    results = await client.search_papers(
+        SearchPlan(filters=SearchFilters(topic="test topic"), raw_query="test")
+    )
+
+    mock_arxiv_search.assert_called_once()
+    assert [paper.arxiv_id for paper in results] == ["2305.12345v1"]
+
+
+def make_pdf_bytes(*pages: str) -> bytes:
+    """Builds a small in-memory PDF with one line of text per page."""
+    import fitz
+
+    doc = fitz.open()
+    for text in pages:
+        page = doc.new_page()
+        page.insert_text((72, 72), text)
+    pdf_bytes = doc.tobytes()
+    doc.close()
+    return pdf_bytes
+
+
+@pytest.mark.asyncio
+async def test_read_paper_from_meta_skips_metadata_lookup():
+    """Reading from a PaperMeta with a pdf_url should only download the PDF."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=make_pdf_bytes("Hello arXiv"))
+
+    client = ArxivApiClient(transport=httpx.MockTransport(handler))
+    meta = PaperMeta(
+        arxiv_id="2305.12345v1",
+        title="Test Paper",
+        authors=[],
+        categories=[],
+        published="2023-05-20",
+        abstract="This is a test abstract.",
+        pdf_url="http://arxiv.org/pdf/2305.12345v1",
+    )
+
+    content = await client.read_paper_from_meta(meta)
+
+    assert [str(request.url) for request in requests] == [meta.pdf_url]
+    assert "Hello arXiv" in content.full_text
+    assert content.abstract == "This is a test abstract."
+
+
+@pytest.mark.asyncio
+async def test_read_papers_batches_missing_metadata():
+    """Papers without a pdf_url should be resolved with a single id_list query."""
+    feed = MOCK_ATOM_FEED.replace(
+        b"</feed>",
+        MOCK_ATOM_FEED[MOCK_ATOM_FEED.index(b"<entry>"):MOCK_ATOM_FEED.index(b"</feed>")]
+        .replace(b"2305.12345", b"2305.99999")
+        + b"</feed>",
+    )
+    api_requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/query":
+            api_requests.append(request)
+            return httpx.Response(200, content=feed)
+        return httpx.Response(200, content=make_pdf_bytes(request.url.path))
+
+    client = ArxivApiClient(transport=httpx.MockTransport(handler))
+    metas = [
+        PaperMeta(arxiv_id=arxiv_id, title="", authors=[], categories=[], published="")
+        for arxiv_id in ("2305.12345", "2305.99999v1")
+    ]
+
+    contents = await client.read_papers(metas)
+
+    assert len(api_requests) == 1
+    assert api_requests[0].url.params["id_list"] == "2305.12345,2305.99999v1"
+    assert "/pdf/2305.12345v1" in contents[0].full_text
+    assert "/pdf/2305.99999v1" in contents[1].full_text
+    assert contents[0].abstract == "This is a test abstract."
+
+
+@pytest.mark.asyncio
+async def test_arxiv_api_client_reuses_pooled_http_client():
+    """All requests should share one HTTP client until the source client is closed."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=make_pdf_bytes("pooled"))
+
+    meta = PaperMeta(
+        arxiv_id="2305.12345v1",
+        title="Test Paper",
+        authors=[],
+        categories=[],
+        published="2023-05-20",
+        pdf_url="http://arxiv.org/pdf/2305.12345v1",
+    )
+
+    async with ArxivApiClient(
+        max_connections=2, transport=httpx.MockTransport(handler)
+    ) as client:
+        await client.read_paper_from_meta(meta)
+        http_client = client.http_client
+        await client.read_paper_from_meta(meta)
+        assert client.http_client is http_client
+
+    assert http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_read_paper_from_meta_serves_from_pdf_store(tmp_path):
+    """A stored PDF should be read from disk without touching the network."""
+    import threading
+
+    from summx.cache import PdfStore
+
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=make_pdf_bytes("downloaded once"))
+
+    store = PdfStore(tmp_path)
+    evict, evicted_in = store.evict, []
+
+    def recording_evict(keep=None):
+        evicted_in.append(threading.current_thread())
+        evict(keep)
+
+    store.evict = recording_evict
+    client = ArxivApiClient(pdf_store=store, transport=httpx.MockTransport(handler))
+    meta = PaperMeta(
+        arxiv_id="2305.12345v1",
+        title="Test Paper",
+        authors=[],
+        categories=[],
+        published="2023-05-20",
+        pdf_url="http://arxiv.org/pdf/2305.12345v1",
+    )
+
+    first = await client.read_paper_from_meta(meta)
+    second = await client.read_paper_from_meta(
+        meta.model_copy(update={"pdf_url": None})
+    )
+
+    assert len(requests) == 1
+    assert meta.local_pdf_path == str(store.path_for("2305.12345v1"))
+    assert first.full_text == second.full_text
+    assert (store.stats.hits, store.stats.misses) == (1, 1)
+    # Eviction scans the store, so it must not run on the event loop's thread
+    assert evicted_in and threading.main_thread() not in evicted_in
+
+
+@pytest.mark.asyncio
+async def test_read_paper_from_meta_serves_from_content_store(tmp_path):
+    """Previously extracted content should skip both download and parsing."""
+    from summx.cache import ContentStore
+
+    requests = []
+    pdf_bytes = make_pdf_bytes("extracted once")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=pdf_bytes)
+
+    store = ContentStore(tmp_path / "content.sqlite3")
+    client = ArxivApiClient(content_store=store, transport=httpx.MockTransport(handler))
+    meta = PaperMeta(
+        arxiv_id="2305.12345v1",
+        title="Test Paper",
+        authors=[],
+        categories=[],
+        published="2023-05-20",
+        pdf_url="http://arxiv.org/pdf/2305.12345v1",
+    )
+
+    import fitz
+
+    with patch("summx.sources.extraction.fitz.open", wraps=fitz.open) as mock_open:
+        first = await client.read_paper_from_meta(meta)
+        second = await client.read_paper_from_meta(meta)
+
+    assert len(requests) == 1
+    assert mock_open.call_count == 1
+    assert first == second
+
+
+@pytest.mark.asyncio
+async def test_search_cache_serves_stale_results_while_refreshing():
+    """Stale results are returned immediately and refreshed in the background."""
+    import asyncio
+
+    from summx.cache import SearchCache
+
+    now = [0.0]
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=MOCK_ATOM_FEED)
+
+    cache = SearchCache(most_recent_ttl=10, clock=lambda: now[0])
+    plan = SearchPlan(filters=SearchFilters(topic="test topic"), raw_query="test")
+
+    async with ArxivApiClient(
+        search_cache=cache,
+        api_limiter=TokenBucket(rate=1000),
+        transport=httpx.MockTransport(handler),
+    ) as client:
+        await client.search_papers(plan)
+        await client.search_papers(plan.model_copy(update={"raw_query": "other"}))
+        assert len(requests) == 1
+
+        now[0] = 20
+        stale = await client.search_papers(plan)
+        assert [paper.arxiv_id for paper in stale] == ["2305.12345v1"]
+        await asyncio.gather(*client._refresh_tasks.values())
+
+    assert len(requests) == 2
+    assert cache.get(client.search_key(plan))[1] is False
+
+
+@pytest.mark.asyncio
+async def test_pdf_extractor_uses_worker_processes(tmp_path):
+    """The process-pool extractor should handle both bytes and file paths."""
+    from summx.sources.extraction import PdfExtractor
+
+    pdf_bytes = make_pdf_bytes("page one", "page two")
+    pdf_path = tmp_path / "paper.pdf"
+    pdf_path.write_bytes(pdf_bytes)
+
+    extractor = PdfExtractor(max_workers=1, max_tasks_per_child=10)
+    try:
+        from_bytes = await extractor.extract(pdf_bytes)
+        from_path = await extractor.extract(str(pdf_path))
+    finally:
+        extractor.shutdown()
+
+    assert "page one" in from_bytes.full_text and "page two" in from_bytes.full_text
+    assert from_path == from_bytes
+
+
+@pytest.mark.asyncio
+async def test_read_paper_streams_to_temporary_file(tmp_path, monkeypatch):
+    """Without a PDF store, downloads go to a temp file that is removed afterwards."""
+    import tempfile
+
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    pdf_bytes = make_pdf_bytes("streamed")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=pdf_bytes)
+
+    client = ArxivApiClient(transport=httpx.MockTransport(handler))
+    meta = PaperMeta(
+        arxiv_id="2305.12345v1",
+        title="Test Paper",
+        authors=[],
+        categories=[],
+        published="2023-05-20",
+        pdf_url="http://arxiv.org/pdf/2305.12345v1",
+    )
+
+    content = await client.read_paper_from_meta(meta)
+
+    assert "streamed" in content.full_text
+    assert meta.local_pdf_path is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_extract_pdf_text_is_depth_aware():
+    """Partial depths should only parse the leading and conclusion pages."""
+    from summx.sources.extraction import SKIPPED_PAGES_MARKER, extract_pdf_text
+
+    pages = [f"body page {n}" for n in range(10)]
+    pages[0] = "Abstract page"
+    pages[5] = "5 Conclusion"
+    pages[7] = "References"
+    pages[8] = "Appendix A"
+    pdf_bytes = make_pdf_bytes(*pages)
+
+    assert extract_pdf_text(pdf_bytes, "abstract").strip() == "Abstract page"
+
+    partial = extract_pdf_text(pdf_bytes, "abstract+intro+conclusion")
+    assert "body page 2" in partial
+    assert "body page 3" not in partial
+    assert "5 Conclusion" in partial and "body page 6" in partial
+    assert "Appendix A" not in partial
+    assert SKIPPED_PAGES_MARKER in partial
+
+    assert "Appendix A" in extract_pdf_text(pdf_bytes, "full")
+
+
+def test_extract_pdf_sections_detects_headings():
+    """Headings set in a larger font should split the text into sections."""
+    import fitz
+
+    from summx.sources.extraction import extract_pdf_sections
+
+    doc = fitz.open()
+    page = doc.new_page()
+    y = 72
+    for text, size in [
+        ("A Paper Title", 18),
+        ("Abstract", 12),
+        ("We study things.", 10),
+        ("1 Introduction", 12),
+        ("Things matter.", 10),
+        ("2 Method", 12),
+        ("2.1 Setup", 10),
+        ("We do things.", 10),
+        ("3 Related Work", 12),
+        ("Others did things.", 10),
+        ("4 Conclusion", 12),
+        ("Things were done.", 10),
+        ("References", 12),
+        ("[1] A reference.", 10),
+    ]:
+        page.insert_text((72, y), text, fontsize=size)
+        y += 24
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    content = extract_pdf_sections(pdf_bytes)
+
+    assert content.abstract == "We study things."
+    assert content.introduction == "Things matter."
+    assert content.methods == "2.1 Setup\nWe do things."
+    assert content.conclusion == "Things were done."
+    assert content.other_sections == {"Related Work": "Others did things."}
+    assert "A reference." in content.full_text
+
+
+def test_token_bucket_spaces_requests_after_burst():
+    """The bucket allows a burst, then one request per interval, and honors pauses."""
+    now = [0.0]
+    bucket = TokenBucket(rate=2, burst=2, clock=lambda: now[0])
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+    now[0] = 10.0
+    bucket.pause(3)
+    assert bucket.reserve() == 3.0
+    assert bucket.reserve() == 3.5
+
+
+@pytest.mark.asyncio
+async def test_throttled_requests_are_retried_honoring_retry_after():
+    """429/503 responses are retried, waiting for Retry-After when it is given."""
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(503),
+        httpx.Response(200, content=MOCK_ATOM_FEED),
+    ]
+    limiter = TokenBucket(rate=1000)
+    limiter.pause = MagicMock(wraps=limiter.pause)
+    client = ArxivApiClient(
+        api_limiter=limiter,
+        retry=RetryPolicy(base_delay=0.001),
+        transport=httpx.MockTransport(lambda request: responses.pop(0)),
+    )
+
+    results = await client.search_papers(
+        SearchPlan(filters=SearchFilters(topic="test topic"), raw_query="test")
+    )
+
+    assert [paper.arxiv_id for paper in results] == ["2305.12345v1"]
+    assert responses == []
+    limiter.pause.assert_called_once_with(0.0)
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
@@ -0,0 +1,150 @@
+import asyncio
+from typing import Dict, List
+
+import pytest
+
+from summx.agent.summarizer import (
+    Summarizer,
+    chunk_text,
+    estimate_tokens,
+    parse_batch_summaries,
+)
+from summx.llm import LLMClient
+from summx.prompts import SUMMARIZER_BATCH_PROMPT, SUMMARIZER_CHUNK_PROMPT
+
+SUMMARY_JSON = (
+    '{"tldr": ["TLDR"], "problem": "Problem", "method": "Method", '
+    '"results": "Results", "limitations": "Limitations", '
+    '"future_work": "Future work", "raw_markdown": "Summary"}'
+)
+
+
+class RecordingLLMClient(LLMClient):
+    """Returns short notes for chunk requests and a JSON summary otherwise."""
+
+    def __init__(self):
+        self.calls: List[List[Dict[str, str]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def chat(self, messages: List[Dict[str, str]]) -> str:
+        self.calls.append(messages)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if messages[0]["content"] == SUMMARIZER_CHUNK_PROMPT:
+            return "short notes"
+        return SUMMARY_JSON
+
+
+def test_chunk_text_respects_budget():
+    """Chunks stay within the budget and keep all of the text."""
+    text = "\n\n".join(f"Paragraph {i} " + "word " * 50 for i in range(20))
+    chunks = chunk_text(text, max_tokens=100)
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 100 for chunk in chunks)
+    assert "".join(chunks) == text
+
+
+@pytest.mark.asyncio
+async def test_summarizer_single_request_when_within_budget():
+    llm = RecordingLLMClient()
+    summary = await Summarizer(llm, token_budget=10_000).summarize("A short paper.")
+
+    assert len(llm.calls) == 1
+    assert summary.problem == "Problem"
+
+
+@pytest.mark.asyncio
+async def test_summarizer_map_reduces_long_text():
+    """Long text is summarized chunk-by-chunk concurrently, then reduced once."""
+    llm = RecordingLLMClient()
+    text = "\n\n".join("word " * 200 for _ in range(10))
+
+    summary = await Summarizer(llm, token_budget=600, max_concurrency=3).summarize(text)
+
+    chunk_calls = [c for c in llm.calls if c[0]["content"] == SUMMARIZER_CHUNK_PROMPT]
+    assert len(chunk_calls) > 1
+    assert len(llm.calls) == len(chunk_calls) + 1
+    assert llm.max_in_flight == 3
+    assert "short notes" in llm.calls[-1][1]["content"]
+    assert summary.problem == "Problem"
+
+
+@pytest.mark.asyncio
+async def test_summarizer_chunks_long_paper_by_token_budget():
+    """A 40k-token paper is split by the input budget, not into tiny chunks."""
+    llm = RecordingLLMClient()
+    text = "\n\n".join("word " * 400 for _ in range(80))
+
+    await Summarizer(llm).summarize(text)
+
+    assert 2 < len(llm.calls) <= 10
+
+
+def test_parse_batch_summaries_keeps_only_valid_keyed_entries():
+    response = (
+        "```json\n["
+        + SUMMARY_JSON.replace("{", '{"id": "P1", ', 1)
+        + ', {"id": "P2", "tldr": []}, '
+        + SUMMARY_JSON.replace("{", '{"id": "P9", ', 1)
+        + "]\n```"
+    )
+
+    parsed = parse_batch_summaries(response, ["P1", "P2"])
+
+    assert list(parsed) == ["P1"]
+    assert parsed["P1"].problem == "Problem"
+    assert parse_batch_summaries("not json", ["P1"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_summarize_batch_packs_papers_and_falls_back_per_paper():
+    """One batched request for all papers; a paper missing from it is retried alone."""
+
+    class BatchLLMClient(RecordingLLMClient):
+        async def chat(self, messages):
+            self.calls.append(messages)
+            if messages[0]["content"] == SUMMARIZER_BATCH_PROMPT:
+                # Answer for the first two papers only
+                return "[" + ", ".join(
+                    SUMMARY_JSON.replace("Problem", f"Problem {key}").replace(
+                        "{", f'{{"id": "{key}", ', 1
+                    )
+                    for key in ("P1", "P2")
+                ) + "]"
+            return SUMMARY_JSON
+
+    llm = BatchLLMClient()
+    summaries = await Summarizer(llm, token_budget=10_000).summarize_batch(
+        ["First abstract.", "Second abstract.", "Third abstract."]
+    )
+
+    assert [s.problem for s in summaries] == ["Problem P1", "Problem P2", "Problem"]
+    assert [call[0]["content"] == SUMMARIZER_BATCH_PROMPT for call in llm.calls] == [
+        True,
+        False,
+    ]
+    assert "Third abstract." in llm.calls[1][1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_summarize_batch_falls_back_per_paper_when_batch_call_fails():
+    """A failed batched request must not cost the papers their summaries."""
+
+    class FailingBatchLLMClient(RecordingLLMClient):
+        async def chat(self, messages):
+            self.calls.append(messages)
+            if messages[0]["content"] == SUMMARIZER_BATCH_PROMPT:
+                raise RuntimeError("provider overloaded")
+            return SUMMARY_JSON
+
+    llm = FailingBatchLLMClient()
+    summaries = await Summarizer(llm, token_budget=10_000).summarize_batch(
+        ["First abstract.", "Second abstract."]
+    )
+
+    assert [s.problem for s in summaries] == ["Problem", "Problem"]
+    assert len(llm.calls) == 3